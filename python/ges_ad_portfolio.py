@@ -1,29 +1,28 @@
-import numpy as np
-import cvxpy as cp
-import pandas as pd
-import matplotlib.pyplot as plt
-R = pd.read_csv('asset_return_data.csv', index_col=0)
-T, N = R.shape
-Mu = R.mean().values
-Return_Dev = (R - Mu).values / T
-Weight = cp.Variable(N)
-Deviation = cp.Variable(T)
-Target_Return = cp.Parameter(nonneg=True)
-Risk_AD = cp.norm(Deviation, 1)
-Opt_Portfolio = cp.Problem(cp.Minimize(Risk_AD),
-                           [Return_Dev @ Weight == Deviation,
-                            Weight.T @ Mu == Target_Return,
-                            cp.sum(Weight) == 1.0,
-                            Weight >= 0.0])
-V_Target = np.linspace(Mu.min(), Mu.max(), num=250)
-V_Risk = np.zeros(V_Target.shape)
-for idx, Target_Return.value in enumerate(V_Target):
-    Opt_Portfolio.solve(solver=cp.ECOS)
-    V_Risk[idx] = Risk_AD.value
-fig1 = plt.figure(num=1, facecolor='w')
-plt.plot(V_Risk, V_Target, 'b-')
-plt.plot((R - Mu).abs().mean().values, Mu, 'rx')
-plt.legend(['frontier', 'asset'], loc='best', frameon=False)
-plt.xlabel('absolute deviation (%)')
-plt.ylabel('expected return (%)')
-plt.show()
+from ges_data import Load_Data, Data_File
+from ges_frontier import Risk_Model, Adaptive_Frontier
+from ges_result_cache import Memoize
+
+
+@Memoize(Files=('File',), Solvers=('absolute deviation',))
+def Analysis(File=Data_File('asset_return_data.csv')):
+    R = Load_Data(File)
+    Mu = R.mean().values
+    Opt_Portfolio = Risk_Model('absolute deviation', Return=R.values)
+    V_Target, V_Risk, V_Weight = Adaptive_Frontier(Opt_Portfolio)
+    return {'Mu': Mu, 'Asset_Risk': (R - Mu).abs().mean().values,
+            'V_Target': V_Target, 'V_Risk': V_Risk, 'V_Weight': V_Weight}
+
+
+def Plot(Result):
+    import matplotlib.pyplot as plt
+    plt.figure(num=1, facecolor='w')
+    plt.plot(Result['V_Risk'], Result['V_Target'], 'b-')
+    plt.plot(Result['Asset_Risk'], Result['Mu'], 'rx')
+    plt.legend(['frontier', 'asset'], loc='best', frameon=False)
+    plt.xlabel('absolute deviation (%)')
+    plt.ylabel('expected return (%)')
+    plt.show()
+
+
+if __name__ == '__main__':
+    Plot(Analysis())
@@ -9,11 +9,19 @@ CorrMatrix = np.array([[1.00, 0.25, 0.18, 0.10, 0.25],
                        [0.10, 0.20, 0.25, 1.00, 0.45],
                        [0.25, 0.20, 0.36, 0.45, 1.00]])
 Sigma = np.diag(Stdev) @ CorrMatrix @ np.diag(Stdev)
-np.random.seed(9999)
-T = 120
-End_of_Month = pd.date_range('1/1/2007', periods=T, freq='M')
-Asset_Names = ['Asset1', 'Asset2', 'Asset3', 'Asset4', 'Asset5']
-Asset_Return = pd.DataFrame(st.multivariate_normal.rvs(mean=Mu, cov=Sigma,
-                                                       size=T),
-                            index=End_of_Month, columns=Asset_Names)
-Asset_Return.to_csv('asset_return_data.csv')
+
+
+def Analysis(T=120):
+    # This seeded draw does not reproduce the bundled asset_return_data.csv;
+    # running the script from this folder overwrites that file.
+    np.random.seed(9999)
+    End_of_Month = pd.date_range('1/1/2007', periods=T, freq='M')
+    Asset_Names = ['Asset1', 'Asset2', 'Asset3', 'Asset4', 'Asset5']
+    Asset_Return = pd.DataFrame(st.multivariate_normal.rvs(mean=Mu, cov=Sigma,
+                                                           size=T),
+                                index=End_of_Month, columns=Asset_Names)
+    return {'Asset_Return': Asset_Return}
+
+
+if __name__ == '__main__':
+    Analysis()['Asset_Return'].to_csv('asset_return_data.csv')
@@ -0,0 +1,241 @@
+import os
+import time
+import numpy as np
+import pandas as pd
+import cvxpy as cp
+from concurrent.futures import ProcessPoolExecutor
+from ges_frontier import Risk_Measures, Default_Solver, Variance_Factors
+
+Backtest_Measures = Risk_Measures + ('tracking error',)
+
+Worker_Asset = None
+Worker_Index = None
+
+
+class Rebalance_Model:
+    # One rebalancing problem, compiled once and re-solved every period:
+    #   min Risk(w) - Risk_Aversion * Mu'w + Penalty * sum(Buy + Sell)
+    #   s.t. w - Previous = Buy - Sell, sum(Buy + Sell) <= Turnover,
+    #        sum(w) = 1, w >= 0, Buy >= 0, Sell >= 0.
+    # Everything that changes between periods is a parameter, so the
+    # problem stays DPP and each period only refills the solver data.
+    # Returns are in percent, so the risk is in percent squared for the
+    # quadratic measures and in percent otherwise. Solve takes the return
+    # and cost terms as fractions of wealth and multiplies them by Scale
+    # (1e4 or 100). The objective is then the all-fractions objective
+    # times Scale, and the risk, return and cost terms share one unit.
+    def __init__(self, Measure, N, Window, Alpha=0.05, Solver=None,
+                 Metrics=None):
+        if Measure not in Backtest_Measures:
+            raise ValueError('unknown risk measure: {0}'.format(Measure))
+        self.Measure = Measure
+        self.Scale = 1e4 if Measure in ('variance', 'semivariance',
+                                        'tracking error') else 100.0
+        self.Solver = Default_Solver.get(Measure, cp.ECOS) if Solver is None \
+                      else Solver
+        self.Weight = cp.Variable(N)
+        Buy = cp.Variable(N, nonneg=True)
+        Sell = cp.Variable(N, nonneg=True)
+        self.Previous = cp.Parameter(N)
+        self.Scaled_Mu = cp.Parameter(N)
+        self.Penalty = cp.Parameter(N, nonneg=True)
+        self.Turnover = cp.Parameter(nonneg=True)
+        Constraints = [cp.sum(self.Weight) == 1.0, self.Weight >= 0.0,
+                       self.Weight - self.Previous == Buy - Sell,
+                       cp.sum(Buy + Sell) <= self.Turnover]
+        if Measure in ('variance', 'tracking error'):
+            # w'Sigma w = ||Factor w||^2 for an N x N factor of the rolling
+            # cross products; tracking error adds the linear cross term.
+            self.Factor = cp.Parameter((N, N))
+            self.Linear = cp.Parameter(N)
+            Risk = cp.sum_squares(self.Factor @ self.Weight) \
+                   - 2.0 * self.Linear @ self.Weight
+        else:
+            self.Scenario = cp.Parameter((Window, N))
+            Deviation = cp.Variable(Window)
+        if Measure == 'semivariance':
+            Risk = cp.sum_squares(Deviation)
+            Constraints += [Deviation >= 0.0,
+                            self.Scenario @ self.Weight + Deviation >= 0.0]
+        elif Measure == 'absolute deviation':
+            Risk = cp.norm(Deviation, 1)
+            Constraints.append(self.Scenario @ self.Weight == Deviation)
+        elif Measure == 'expected shortfall':
+            VaR = cp.Variable()
+            Risk = cp.sum(Deviation) / Alpha - VaR
+            Constraints += [Deviation >= 0.0,
+                            self.Scenario @ self.Weight - VaR / Window
+                            + Deviation >= 0.0]
+        self.Risk = Risk
+        self.Problem = cp.Problem(cp.Minimize(
+            Risk - self.Scaled_Mu @ self.Weight
+            + self.Penalty @ (Buy + Sell)), Constraints)
+        self.Solves = 0
+        self.Metrics = Metrics
+
+    def Set_Window(self, Window_Return, Gram=None, Cross=None, Total=None):
+        # Gram, Cross and Total are the window's running sums A'A, A'b and
+        # sum(A) for the factor-based measures.
+        T = Window_Return.shape[0]
+        Mu = Total / T if Total is not None else Window_Return.mean(axis=0)
+        if self.Measure == 'variance':
+            self.Factor.value = Variance_Factors(
+                None, Gram / T - np.outer(Mu, Mu), None)[0]
+            self.Linear.value = np.zeros(Mu.shape[0])
+        elif self.Measure == 'tracking error':
+            self.Factor.value = Variance_Factors(None, Gram / T, None)[0]
+            self.Linear.value = Cross / T
+        elif self.Measure == 'semivariance':
+            self.Scenario.value = (Window_Return - Mu) / np.sqrt(T)
+        elif self.Measure == 'absolute deviation':
+            self.Scenario.value = (Window_Return - Mu) / T
+        else:
+            self.Scenario.value = Window_Return / T
+        return Mu
+
+    def Solve(self, Previous, Scaled_Mu, Penalty, Turnover, Period=None):
+        # Scaled_Mu and Penalty are in fractions of wealth.
+        self.Previous.value = Previous
+        self.Scaled_Mu.value = self.Scale * Scaled_Mu
+        self.Penalty.value = self.Scale * np.broadcast_to(Penalty,
+                                                          Previous.shape)
+        self.Turnover.value = Turnover
+        Start = time.perf_counter()
+        Status = None
+        try:
+            self.Problem.solve(solver=self.Solver, warm_start=True)
+            Status = self.Problem.status
+        except cp.error.SolverError:
+            Status = 'solver_error'
+        finally:
+            self.Solves += 1
+            if self.Metrics is not None:
+                self.Record_Metrics(Period, Status,
+                                    time.perf_counter() - Start)
+        if Status not in (cp.OPTIMAL, cp.OPTIMAL_INACCURATE):
+            return None
+        Weight = np.maximum(self.Weight.value, 0.0)
+        return Weight / Weight.sum()
+
+    def Record_Metrics(self, Period, Status, Time):
+        # Problem.solve does not split its time into phases, so all of it
+        # is counted as solve time.
+        Stats = self.Problem.solver_stats \
+                if Status in (cp.OPTIMAL, cp.OPTIMAL_INACCURATE) else None
+        self.Metrics.Record(
+            measure=self.Measure, formulation='rebalance', solver=self.Solver,
+            period=Period, status=Status,
+            iterations=getattr(Stats, 'num_iters', None),
+            solver_time=getattr(Stats, 'solve_time', None), compile=0.0,
+            update=0.0, solve=Time, unpack=0.0, residual=np.nan)
+
+
+def Backtest(Asset, Measure='variance', Window=96, Rebalance=1, Index=None,
+             Alpha=0.05, Cost=0.0, Turnover=None, Risk_Aversion=0.0,
+             Cost_Aversion=1.0, Refresh=None, Solver=None, Initial=None,
+             Metrics=None):
+    # Returns are in percent. At each rebalancing date the weights, drifted
+    # by the returns since the last trade, are moved to the optimum over
+    # the trailing window. Cost is charged per unit traded (as a fraction
+    # of wealth) and deducted from the first return after the trade;
+    # Turnover bounds sum(|w - Previous|), except on the first trade when
+    # starting from cash (Initial=None). Metrics, a Solver_Metrics, gets
+    # one record per rebalancing solve.
+    Asset = np.asarray(Asset, dtype=float)
+    T, N = Asset.shape
+    if Measure == 'tracking error':
+        if Index is None:
+            raise ValueError('tracking error requires an index')
+        Index = np.asarray(Index, dtype=float)
+    BackTesting = T - Window
+    Refresh = Window if Refresh is None else Refresh
+    Model = Rebalance_Model(Measure, N, Window, Alpha, Solver, Metrics)
+    V_Start = np.arange(0, BackTesting, Rebalance)
+    V_Weight = np.zeros((V_Start.shape[0], N))
+    V_Turnover = np.zeros(V_Start.shape[0])
+    V_Return = np.zeros(BackTesting)
+    Weight = np.zeros(N) if Initial is None else np.asarray(Initial, float)
+    Factor_Based = Measure in ('variance', 'tracking error')
+    Last = None
+    for idx, Start in enumerate(V_Start):
+        A = Asset[Start:(Start + Window)]
+        if Factor_Based:
+            b = Index[Start:(Start + Window)] if Index is not None else None
+            if Last is None or Start - Last >= Window or idx % Refresh == 0:
+                Gram, Total = A.T @ A, A.sum(axis=0)
+                Cross = A.T @ b if b is not None else None
+            else:
+                # Slide the window: add the new rows and drop the old ones.
+                Add = slice(Last + Window, Start + Window)
+                Drop = slice(Last, Start)
+                Gram += Asset[Add].T @ Asset[Add] - Asset[Drop].T @ Asset[Drop]
+                Total += Asset[Add].sum(axis=0) - Asset[Drop].sum(axis=0)
+                if Cross is not None:
+                    Cross += Asset[Add].T @ Index[Add] \
+                             - Asset[Drop].T @ Index[Drop]
+            Mu = Model.Set_Window(A, Gram, Cross, Total)
+        else:
+            Mu = Model.Set_Window(A)
+        Limit = 2.0 if Turnover is None or Weight.sum() == 0.0 else Turnover
+        New_Weight = Model.Solve(Weight, 0.01 * Risk_Aversion * Mu,
+                                 Cost * Cost_Aversion, Limit, int(Start))
+        if New_Weight is None:
+            # Hold the drifted weights when the solver fails.
+            New_Weight = Weight if Weight.sum() > 0.0 else np.full(N, 1.0 / N)
+        V_Turnover[idx] = np.abs(New_Weight - Weight).sum()
+        Weight = New_Weight
+        V_Weight[idx, :] = Weight
+        # Buy and hold until the next rebalancing date.
+        Hold = np.arange(Start, min(Start + Rebalance, BackTesting))
+        for t in Hold:
+            Gross = Asset[t + Window] @ Weight
+            V_Return[t] = Gross
+            Weight = Weight * (1.0 + 0.01 * Asset[t + Window]) \
+                     / (1.0 + 0.01 * Gross)
+        V_Return[Start] -= 100 * Cost * V_Turnover[idx]
+        Last = Start
+    return V_Weight, V_Return, V_Turnover
+
+
+def Backtest_Statistics(V_Return, V_Turnover, Index=None):
+    Statistics = {'mean return': V_Return.mean(),
+                  'volatility': V_Return.std(),
+                  'total turnover': V_Turnover.sum(),
+                  'mean turnover': V_Turnover.mean()}
+    if Index is not None:
+        Statistics['tracking error'] = (V_Return - Index).std()
+    return Statistics
+
+
+def Initialize_Worker(Asset, Index):
+    global Worker_Asset, Worker_Index
+    Worker_Asset, Worker_Index = Asset, Index
+
+
+def Backtest_Task(Config):
+    V_Weight, V_Return, V_Turnover = Backtest(Worker_Asset, Index=Worker_Index,
+                                              **Config)
+    Window = Config.get('Window', 96)
+    Index = None if Worker_Index is None else Worker_Index[Window:]
+    return (V_Weight, V_Return, V_Turnover), \
+           Backtest_Statistics(V_Return, V_Turnover, Index)
+
+
+def Backtest_Grid(Asset, V_Config, Index=None, Workers=None):
+    # V_Config is a list of keyword dicts for Backtest; each configuration
+    # is one task, and the data is sent to each worker once.
+    Asset = np.asarray(Asset, dtype=float)
+    Index = None if Index is None else np.asarray(Index, dtype=float)
+    Workers = os.cpu_count() if Workers is None else Workers
+    if Workers <= 1 or len(V_Config) <= 1:
+        Initialize_Worker(Asset, Index)
+        Output = [Backtest_Task(Config) for Config in V_Config]
+    else:
+        with ProcessPoolExecutor(max_workers=Workers,
+                                 initializer=Initialize_Worker,
+                                 initargs=(Asset, Index)) as Executor:
+            Output = list(Executor.map(Backtest_Task, V_Config))
+    Summary = pd.concat((pd.DataFrame(V_Config),
+                         pd.DataFrame([Statistics for _, Statistics in Output])),
+                        axis=1)
+    return Summary, [Result for Result, _ in Output]
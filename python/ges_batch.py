@@ -0,0 +1,107 @@
+import argparse
+import importlib
+import os
+import sys
+import time
+import warnings
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+Analyses = {
+    'mvf example1': 'ges_mvf_example1',
+    'mvf example2': 'ges_mvf_example2',
+    'mvf example3': 'ges_mvf_example3',
+    'semivariance': 'ges_sv_portfolio',
+    'absolute deviation': 'ges_ad_portfolio',
+    'expected shortfall': 'ges_es_portfolio',
+    'tracking error': 'ges_min_tracking_error',
+    'risk parity': 'ges_risk_parity',
+    'capm': 'ges_capm',
+    'bond yield price': 'ges_bond_yield_price',
+    'bond duration convexity': 'ges_bond_duration_convexity',
+    'bond yield curve': 'ges_bond_yield_curve',
+    'interest': 'ges_interest',
+    'npv irr': 'ges_npv_irr',
+    'black scholes': 'ges_black_scholes',
+    'option pricing': 'ges_option_pricing',
+    'asset return simulation': 'ges_asset_return_simulation',
+}
+
+
+def Run_Analysis(Name):
+    return importlib.import_module(Analyses[Name]).Analysis()
+
+
+def Write_Result(Result, Folder):
+    # Tables go to CSV files and everything else to one npz archive; each
+    # file is written under a temporary name and then moved into place.
+    os.makedirs(Folder, exist_ok=True)
+    Arrays = {}
+    Files = []
+    for Key, Value in Result.items():
+        if isinstance(Value, (pd.DataFrame, pd.Series)):
+            Path = os.path.join(Folder, Key + '.csv')
+            Value.to_csv(Path + '.tmp')
+            os.replace(Path + '.tmp', Path)
+            Files.append(Path)
+        else:
+            Arrays[Key] = np.asarray(Value)
+    if Arrays:
+        Path = os.path.join(Folder, 'arrays.npz')
+        with open(Path + '.tmp', 'wb') as Output:
+            np.savez(Output, **Arrays)
+        os.replace(Path + '.tmp', Path)
+        Files.append(Path)
+    return Files
+
+
+def Batch_Task(Name, Output):
+    Start = time.perf_counter()
+    Files = Write_Result(Run_Analysis(Name),
+                         os.path.join(Output, Analyses[Name]))
+    return Name, time.perf_counter() - Start, Files
+
+
+def Run_Batch(Names=None, Output='ges_results', Workers=None):
+    # Each analysis runs in its own worker process and writes its own
+    # folder, so nothing but the file list comes back to the parent.
+    Names = list(Analyses) if not Names else Names
+    Result = {}
+    if Workers == 1:
+        for Name in Names:
+            Result[Name] = Batch_Task(Name, Output)[1:]
+        return Result
+    with ProcessPoolExecutor(max_workers=Workers) as Executor:
+        Futures = [Executor.submit(Batch_Task, Name, Output) for Name in Names]
+        for Future in as_completed(Futures):
+            Name, Time, Files = Future.result()
+            Result[Name] = Time, Files
+    return Result
+
+
+def Main(Arguments=None):
+    Parser = argparse.ArgumentParser(
+        description='Run the analyses without plotting and save the results.')
+    Parser.add_argument('--output', default='ges_results')
+    Parser.add_argument('--workers', type=int, default=None)
+    Parser.add_argument('names', nargs='*',
+                        help='analyses to run (default: all): '
+                             + ', '.join(Analyses))
+    Options = Parser.parse_args(Arguments)
+    Unknown = set(Options.names) - set(Analyses)
+    if Unknown:
+        Parser.error('unknown analyses: ' + ', '.join(sorted(Unknown)))
+    with warnings.catch_warnings():
+        # cvxpy warns on every ECOS solve that ECOS will stop being
+        # installed with it; every other warning still shows.
+        warnings.filterwarnings('ignore', category=FutureWarning,
+                                module='cvxpy')
+        Result = Run_Batch(Options.names, Options.output, Options.workers)
+    for Name, (Time, Files) in Result.items():
+        print('{0:30s} {1:10.4f} s {2}'.format(Name, Time, ', '.join(Files)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(Main())
@@ -0,0 +1,288 @@
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+import warnings
+import numpy as np
+
+
+def Random_Market(T, N, Seed=0):
+    rng = np.random.default_rng(Seed)
+    Loading = rng.normal(size=(N, 3))
+    Return = rng.normal(size=(T, 3)) @ Loading.T * 2.0 \
+             + rng.normal(size=(T, N)) * 4.0 + rng.uniform(0.5, 1.5, N)
+    return Return
+
+
+def Total_Iterations(Metrics):
+    # Solves that failed before reporting count as no iterations.
+    return sum(Record['iterations'] or 0 for Record in Metrics.Records)
+
+
+def Bench_Bond_Analytics(Size):
+    from ges_bond_engine import Bond_Analytics
+    rng = np.random.default_rng(0)
+    n = Size['Bonds']
+    Args = (rng.uniform(0, 10, n), rng.integers(1, 31, n),
+            rng.uniform(0, 8, n), 100.0)
+
+    def Run():
+        Bond_Analytics(*Args)
+    return Run
+
+
+def Bench_Yield_Solver(Size):
+    from ges_yield_solver import Bond_Yield_Batch
+    rng = np.random.default_rng(0)
+    n = Size['Bonds']
+    Args = (rng.uniform(80, 120, n), rng.integers(1, 31, n),
+            rng.uniform(0, 8, n), 100.0)
+
+    def Run():
+        Bond_Yield_Batch(*Args)
+    return Run
+
+
+def Bench_Frontier(Measure):
+    def Setup(Size):
+        from ges_frontier import Risk_Model, Frontier_Sweep
+        from ges_solver_metrics import Solver_Metrics
+        Return = Random_Market(Size['T'], Size['N'])
+        Mu = Return.mean(axis=0)
+        V_Target = np.linspace(Mu.min(), Mu.max(), Size['Targets'])
+
+        def Run():
+            Model = Risk_Model(Measure, Return=Return,
+                               Metrics=Solver_Metrics())
+            Frontier_Sweep(Model, V_Target)
+            return Total_Iterations(Model.Metrics)
+        return Run
+    return Setup
+
+
+def Bench_CVaR(Size):
+    from ges_cvar import CVaR_Optimize
+    Return = Random_Market(Size['T'], Size['N'])
+    Target = np.median(Return.mean(axis=0))
+    return lambda: CVaR_Optimize(Return, Target, 0.05)[5]
+
+
+def Bench_ES_Grid(Size):
+    from ges_es_scenario import ES_Frontier_Grid
+    from ges_solver_metrics import Solver_Metrics
+    Return = Random_Market(Size['T'], Size['N'])
+    Mu = Return.mean(axis=0)
+    V_Alpha = np.linspace(0.05, 0.25, Size['Alphas'])
+    V_Target = np.linspace(Mu.min(), Mu.max(), Size['Targets'])
+
+    def Run():
+        Metrics = Solver_Metrics()
+        ES_Frontier_Grid(Return, V_Alpha, V_Target, Workers=1, Metrics=Metrics)
+        return Total_Iterations(Metrics)
+    return Run
+
+
+def Bench_Critical_Line(Size):
+    # The efficient branch is all of Critical_Line's work; it makes one
+    # iteration per turning point after the first.
+    from ges_critical_line import Critical_Line_Branch
+    N = Size['N']
+    Return = Random_Market(2 * N, N)
+    Mu, Sigma = Return.mean(axis=0), np.cov(Return.T)
+    return lambda: Critical_Line_Branch(Mu, Sigma, np.zeros(N), np.ones(N),
+                                        1e-10)[0].shape[0] - 1
+
+
+def Bench_Tracking_Backtest(Size):
+    from ges_tracking_backtest import Tracking_Backtest
+    from ges_solver_metrics import Solver_Metrics
+    Return = Random_Market(Size['T'], Size['N'])
+    Index = Return.mean(axis=1)
+
+    def Run():
+        Metrics = Solver_Metrics()
+        Tracking_Backtest(Return, Index, Size['Window'], Metrics=Metrics)
+        return Total_Iterations(Metrics)
+    return Run
+
+
+def Bench_Risk_Budget(Size):
+    from ges_risk_budget import Risk_Budget
+    Return = Random_Market(2 * Size['N'], Size['N'])
+    Sigma = np.cov(Return.T)
+    return lambda: Risk_Budget(Sigma)[1]
+
+
+def Bench_Binomial(Size):
+    from ges_option_engine import Binomial_Lattice
+    N = Size['Steps']
+    dt = 0.5 / N
+    u, f = np.exp(0.2 * np.sqrt(dt)), np.exp(0.01 * dt)
+    K = np.linspace(80.0, 120.0, Size['Strikes'])
+
+    def Run():
+        Binomial_Lattice(100.0, K, u, f, N)
+    return Run
+
+
+def Bench_CAPM(Size):
+    from ges_regression import Rolling_Regression
+    Return = Random_Market(Size['T'], Size['Stocks'])
+    Market = Return.mean(axis=1)
+
+    def Run():
+        Rolling_Regression(Return, Market, Size['Window'])
+    return Run
+
+
+def Bench_Backtest(Size):
+    from ges_backtest import Backtest
+    from ges_solver_metrics import Solver_Metrics
+    Return = Random_Market(Size['T'], Size['N'])
+
+    def Run():
+        Metrics = Solver_Metrics()
+        Backtest(Return, 'variance', Size['Window'], Rebalance=5, Cost=0.001,
+                 Turnover=0.3, Metrics=Metrics)
+        return Total_Iterations(Metrics)
+    return Run
+
+
+Benchmarks = {
+    'bond analytics': (Bench_Bond_Analytics,
+                       [{'Bonds': 10000}, {'Bonds': 100000}]),
+    'yield solver': (Bench_Yield_Solver,
+                     [{'Bonds': 1000}, {'Bonds': 10000}]),
+    'frontier variance': (Bench_Frontier('variance'),
+                          [{'T': 120, 'N': 5, 'Targets': 50},
+                           {'T': 2500, 'N': 100, 'Targets': 20}]),
+    'frontier semivariance': (Bench_Frontier('semivariance'),
+                              [{'T': 120, 'N': 5, 'Targets': 50},
+                               {'T': 1000, 'N': 50, 'Targets': 10}]),
+    'frontier absolute deviation': (Bench_Frontier('absolute deviation'),
+                                    [{'T': 120, 'N': 5, 'Targets': 50},
+                                     {'T': 1000, 'N': 50, 'Targets': 10}]),
+    'frontier expected shortfall': (Bench_Frontier('expected shortfall'),
+                                    [{'T': 120, 'N': 5, 'Targets': 50},
+                                     {'T': 1000, 'N': 50, 'Targets': 10}]),
+    'cvar engine': (Bench_CVaR, [{'T': 20000, 'N': 20},
+                                 {'T': 100000, 'N': 20}]),
+    'es frontier grid': (Bench_ES_Grid,
+                         [{'T': 5000, 'N': 10, 'Alphas': 2, 'Targets': 10},
+                          {'T': 20000, 'N': 20, 'Alphas': 2,
+                           'Targets': 10}]),
+    'critical line': (Bench_Critical_Line, [{'N': 50}, {'N': 500}]),
+    'tracking backtest': (Bench_Tracking_Backtest,
+                          [{'T': 240, 'N': 5, 'Window': 96},
+                           {'T': 1000, 'N': 50, 'Window': 250}]),
+    'risk budget': (Bench_Risk_Budget, [{'N': 100}, {'N': 1000}]),
+    'binomial lattice': (Bench_Binomial,
+                         [{'Steps': 1000, 'Strikes': 5},
+                          {'Steps': 5000, 'Strikes': 5}]),
+    'capm regression': (Bench_CAPM,
+                        [{'T': 240, 'Stocks': 100, 'Window': 60},
+                         {'T': 240, 'Stocks': 3000, 'Window': 60}]),
+    'rebalancing backtest': (Bench_Backtest,
+                             [{'T': 240, 'N': 5, 'Window': 96},
+                              {'T': 1000, 'N': 50, 'Window': 250}]),
+}
+
+
+def Benchmark_Key(Name, Size):
+    return '{0} ({1})'.format(Name, ', '.join('{0}={1}'.format(Key, Value)
+                                              for Key, Value in Size.items()))
+
+
+def Run_Benchmark(Setup, Size, Repeat=3):
+    # Time the best of Repeat runs, then measure the peak traced memory in
+    # a separate run so that tracing does not distort the timings. A run
+    # returns the total iterations of the solvers it calls, or None when
+    # the kernel has no iterative solver.
+    Run = Setup(Size)
+    Time = np.inf
+    for _ in range(Repeat):
+        Start = time.perf_counter()
+        Iterations = Run()
+        Time = min(Time, time.perf_counter() - Start)
+    tracemalloc.start()
+    Run()
+    Memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {'time': Time, 'memory': Memory,
+            'iterations': None if Iterations is None else int(Iterations)}
+
+
+def Compare_Baseline(Result, Baseline, Threshold=0.25):
+    Regression = []
+    for Key, Record in Result.items():
+        if Key not in Baseline:
+            continue
+        for Metric in ('time', 'memory'):
+            Old = Baseline[Key][Metric]
+            if Old > 0 and Record[Metric] > Old * (1.0 + Threshold):
+                Regression.append((Key, Metric, Old, Record[Metric]))
+    return Regression
+
+
+def Run_Suite(Names=None, Quick=False, Repeat=3):
+    Result = {}
+    for Name, (Setup, Sizes) in Benchmarks.items():
+        if Names and Name not in Names:
+            continue
+        for Size in Sizes[:1] if Quick else Sizes:
+            Key = Benchmark_Key(Name, Size)
+            Result[Key] = Run_Benchmark(Setup, Size, Repeat)
+            print('{0:60s} {1:10.4f} s {2:10.1f} MB {3:>8}'.format(
+                Key, Result[Key]['time'], Result[Key]['memory'] / 2 ** 20,
+                '' if Result[Key]['iterations'] is None
+                else Result[Key]['iterations']))
+    return Result
+
+
+def Main(Arguments=None):
+    Parser = argparse.ArgumentParser(
+        description='Time the numerical kernels against a JSON baseline.')
+    Parser.add_argument('--baseline', default='ges_benchmark.json')
+    Parser.add_argument('--save', action='store_true',
+                        help='write the results as the new baseline')
+    Parser.add_argument('--threshold', type=float, default=0.25)
+    Parser.add_argument('--repeat', type=int, default=3)
+    Parser.add_argument('--quick', action='store_true',
+                        help='run only the smallest size of each kernel')
+    Parser.add_argument('names', nargs='*',
+                        help='kernels to run (default: all): '
+                             + ', '.join(Benchmarks))
+    Options = Parser.parse_args(Arguments)
+    Unknown = set(Options.names) - set(Benchmarks)
+    if Unknown:
+        Parser.error('unknown kernels: ' + ', '.join(sorted(Unknown)))
+    with warnings.catch_warnings():
+        # cvxpy warns on every ECOS solve that ECOS will stop being
+        # installed with it; every other warning still shows.
+        warnings.filterwarnings('ignore', category=FutureWarning,
+                                module='cvxpy')
+        Result = Run_Suite(Options.names, Options.quick, Options.repeat)
+    Status = 0
+    if os.path.exists(Options.baseline):
+        with open(Options.baseline) as File:
+            Baseline = json.load(File)
+        for Key, Metric, Old, New in Compare_Baseline(Result, Baseline,
+                                                      Options.threshold):
+            print('regression: {0} {1} {2:.4g} -> {3:.4g}'.format(
+                Key, Metric, Old, New))
+            Status = 1
+    if Options.save:
+        Baseline = {}
+        if os.path.exists(Options.baseline):
+            with open(Options.baseline) as File:
+                Baseline = json.load(File)
+        Baseline.update(Result)
+        with open(Options.baseline, 'w') as File:
+            json.dump(Baseline, File, indent=2, sort_keys=True)
+    return Status
+
+
+if __name__ == '__main__':
+    sys.exit(Main())
@@ -1,10 +1,17 @@
-import numpy as np
-import scipy.stats as st
+from ges_option_engine import Black_Scholes
 S = 100.0
 K = 100.0
 r = 0.01
 v = 0.20
 T = 0.50
-d1 = (np.log(S / K) + (r + 0.5 * v ** 2) * T) / (v * np.sqrt(T))
-d2 = d1 - v * np.sqrt(T)
-BS_Formula = S * st.norm.cdf(d1) - K * np.exp(-r * T) * st.norm.cdf(d2)
+
+
+def Analysis():
+    BS_Formula, Delta, Gamma, Vega, Theta, Rho = Black_Scholes(S, K, r, v, T)
+    return {'BS_Formula': BS_Formula, 'Delta': Delta, 'Gamma': Gamma,
+            'Vega': Vega, 'Theta': Theta, 'Rho': Rho}
+
+
+if __name__ == '__main__':
+    for Key, Value in Analysis().items():
+        print('{0:10s} {1:12.6f}'.format(Key, Value))
@@ -0,0 +1,55 @@
+import numpy as np
+
+
+def Bond_Cash_Flow_Matrix(Maturity, CouponRate, FaceValue):
+    Maturity, CouponRate, FaceValue = np.broadcast_arrays(
+        np.asarray(Maturity).astype(int), np.asarray(CouponRate, dtype=float),
+        np.asarray(FaceValue, dtype=float))
+    Time = np.arange(1, Maturity.max() + 1)
+    Coupon = 0.01 * CouponRate * FaceValue
+    CF = Coupon[..., np.newaxis] * (Time <= Maturity[..., np.newaxis]) \
+         + FaceValue[..., np.newaxis] * (Time == Maturity[..., np.newaxis])
+    return Time, CF
+
+
+def Bond_Analytics(Yield, Maturity, CouponRate, FaceValue):
+    Yield = np.asarray(Yield, dtype=float)
+    Maturity = np.asarray(Maturity).astype(int)
+    FaceValue = np.asarray(FaceValue, dtype=float)
+    Coupon = 0.01 * np.asarray(CouponRate, dtype=float) * FaceValue
+    Shape = np.broadcast_shapes(Yield.shape, Maturity.shape, Coupon.shape,
+                                FaceValue.shape)
+    Discount = 1.0 / (1.0 + 0.01 * Yield)
+    Factor = np.ones(Yield.shape)
+    CF = np.empty(np.broadcast_shapes(Maturity.shape, Coupon.shape,
+                                      FaceValue.shape))
+    Flow = np.empty(Shape)
+    Work = np.empty(Shape)
+    PV = np.zeros(Shape)
+    PV_Time = np.zeros(Shape)
+    PV_Time2 = np.zeros(Shape)
+    for t in range(1, int(Maturity.max(initial=0)) + 1):
+        Factor *= Discount
+        np.multiply(Coupon, t <= Maturity, out=CF)
+        CF += FaceValue * (t == Maturity)
+        np.multiply(CF, Factor, out=Flow)
+        PV += Flow
+        np.multiply(Flow, t, out=Work)
+        PV_Time += Work
+        Work *= t
+        PV_Time2 += Work
+    Duration = PV_Time / PV
+    Convexity = (PV_Time2 / PV + Duration) * Discount ** 2
+    return PV[()], Duration[()], Convexity[()]
+
+
+def Bond_Grid_Analytics(V_Yield, Maturity, CouponRate, FaceValue):
+    V_Yield = np.atleast_1d(np.asarray(V_Yield, dtype=float))
+    Time, CF = Bond_Cash_Flow_Matrix(Maturity, CouponRate, FaceValue)
+    Discount = 1.0 / (1.0 + 0.01 * V_Yield)
+    Factor = Discount[:, np.newaxis] ** Time
+    PV = Factor @ CF.T
+    Duration = (Factor * Time) @ CF.T / PV
+    Convexity = ((Factor * Time ** 2) @ CF.T / PV + Duration) \
+                * (Discount ** 2)[:, np.newaxis]
+    return PV, Duration, Convexity
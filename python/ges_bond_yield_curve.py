@@ -1,16 +1,11 @@
 import numpy as np
-import numpy.polynomial.polynomial as pol
-import numpy.linalg as la
-import matplotlib.pyplot as plt
+from ges_yield_solver import Bond_Yield_Batch
+from ges_result_cache import Cached_Bootstrap_Curve
 
 
 def Bond_Yield(Price, Maturity, CouponRate, FaceValue):
-    Coupon = 0.01 * CouponRate * FaceValue
-    CF = np.hstack((-Price, np.tile(Coupon, int(Maturity) - 1), FaceValue + Coupon))
-    Roots = pol.polyroots(CF)
-    Real = np.real(Roots[np.isreal(Roots)])
-    Positive = (Real[Real > 0.0]).item(0)
-    return (1.0 / Positive - 1.0) * 100
+    return Bond_Yield_Batch(Price, Maturity, CouponRate, FaceValue,
+                            Fallback=True)[0]
 
 
 Bond = np.array([
@@ -26,18 +21,26 @@ Bond = np.array([
     [ 97.00, 10, 2.5]
 ])
 F = 100
-Yield = np.array([Bond_Yield(Bond[idx,0], Bond[idx,1], Bond[idx,2], F)
-                  for idx in range(0, Bond.shape[0])])
-P = Bond[:,0]
-C = F * np.identity(Bond.shape[0]) \
-    + np.tril(np.transpose(np.tile(0.01 * Bond[:, 2] * F, (Bond.shape[0], 1))))
-V = la.solve(C, P)
-ZeroRate = (np.power(1.0 / V, 1.0 / Bond[:, 1]) - 1.0) * 100
-fig1 = plt.figure(num=1, facecolor='w')
-plt.plot(Bond[:,1], ZeroRate, 'b-')
-plt.plot(Bond[:,1], Yield, 'r--')
-plt.xlabel('time to maturity')
-plt.ylabel('yield')
-plt.legend(['yield curve (zero-coupon bond)',
-            'yield curve (coupon-bearing bond)'], loc='best', frameon=False)
-plt.show()
+
+
+def Analysis():
+    Yield = Bond_Yield(Bond[:,0], Bond[:,1], Bond[:,2], F)
+    Curve = Cached_Bootstrap_Curve(Bond[:,0], Bond[:,1], Bond[:,2], F)
+    ZeroRate = Curve.Zero_Rate(Bond[:,1])
+    return {'Maturity': Bond[:,1], 'Yield': Yield, 'ZeroRate': ZeroRate}
+
+
+def Plot(Result):
+    import matplotlib.pyplot as plt
+    plt.figure(num=1, facecolor='w')
+    plt.plot(Result['Maturity'], Result['ZeroRate'], 'b-')
+    plt.plot(Result['Maturity'], Result['Yield'], 'r--')
+    plt.xlabel('time to maturity')
+    plt.ylabel('yield')
+    plt.legend(['yield curve (zero-coupon bond)',
+                'yield curve (coupon-bearing bond)'], loc='best', frameon=False)
+    plt.show()
+
+
+if __name__ == '__main__':
+    Plot(Analysis())
@@ -0,0 +1,126 @@
+import numpy as np
+import scipy.linalg as la
+
+
+class Covariance:
+    def __init__(self, Matrix):
+        self.Matrix = np.asarray(Matrix, dtype=float)
+        self.Factor = None
+
+    @property
+    def N(self):
+        return self.Matrix.shape[0]
+
+    def Dense(self):
+        return self.Matrix
+
+    def Diagonal(self):
+        return np.diagonal(self.Matrix)
+
+    def Cholesky(self):
+        if self.Factor is None:
+            self.Factor = la.cho_factor(self.Matrix, lower=True)
+        return self.Factor
+
+    def Dot(self, x):
+        return self.Matrix @ x
+
+    def Solve(self, b):
+        return la.cho_solve(self.Cholesky(), b)
+
+    def Quad_Form(self, x):
+        return np.einsum('i...,i...->...', x, self.Dot(x))
+
+    def Inverse_Quad_Form(self, x, y=None):
+        y = x if y is None else y
+        return np.einsum('i...,i...->...', x, self.Solve(y))
+
+
+class Factor_Covariance(Covariance):
+    # Sigma = Loading @ Factor_Cov @ Loading.T + diag(Specific), applied
+    # and inverted (Woodbury) without forming any N x N matrix.
+    def __init__(self, Loading, Factor_Cov, Specific):
+        self.Loading = np.asarray(Loading, dtype=float)
+        self.Factor_Cov = np.asarray(Factor_Cov, dtype=float)
+        self.Specific = np.asarray(Specific, dtype=float)
+        self.Factor = None
+
+    @property
+    def N(self):
+        return self.Loading.shape[0]
+
+    def Dense(self):
+        return self.Loading @ self.Factor_Cov @ self.Loading.T \
+               + np.diag(self.Specific)
+
+    def Diagonal(self):
+        return np.einsum('ij,jk,ik->i', self.Loading, self.Factor_Cov,
+                         self.Loading) + self.Specific
+
+    def Cholesky(self):
+        # Factors of Factor_Cov and of the K x K capacitance matrix
+        # inv(Factor_Cov) + Loading' inv(D) Loading.
+        if self.Factor is None:
+            Factor_Cov = la.cho_factor(self.Factor_Cov, lower=True)
+            Scaled = self.Loading / self.Specific[:, np.newaxis]
+            Capacitance = la.cho_solve(Factor_Cov,
+                                       np.identity(self.Factor_Cov.shape[0])) \
+                          + self.Loading.T @ Scaled
+            self.Factor = Factor_Cov, la.cho_factor(Capacitance, lower=True)
+        return self.Factor
+
+    def Dot(self, x):
+        Specific = self.Specific.reshape((-1,) + (1,) * (np.ndim(x) - 1))
+        return self.Loading @ (self.Factor_Cov @ (self.Loading.T @ x)) \
+               + Specific * x
+
+    def Solve(self, b):
+        Specific = self.Specific.reshape((-1,) + (1,) * (np.ndim(b) - 1))
+        Scaled = b / Specific
+        Correction = la.cho_solve(self.Cholesky()[1], self.Loading.T @ Scaled)
+        return Scaled - (self.Loading @ Correction) / Specific
+
+
+def Correlation_Covariance(Stdev, CorrMatrix):
+    Stdev = np.asarray(Stdev, dtype=float)
+    return Covariance(Stdev[:, np.newaxis] * CorrMatrix * Stdev)
+
+
+def Sample_Covariance(Return, ddof=0):
+    Return = np.asarray(Return, dtype=float)
+    Deviation = Return - Return.mean(axis=0)
+    return Covariance(Deviation.T @ Deviation / (Return.shape[0] - ddof))
+
+
+def Ledoit_Wolf_Covariance(Return):
+    # Shrink the sample covariance towards a scaled identity with the
+    # Ledoit-Wolf (2004) intensity.
+    Return = np.asarray(Return, dtype=float)
+    T, N = Return.shape
+    Deviation = Return - Return.mean(axis=0)
+    S = Deviation.T @ Deviation / T
+    m = np.trace(S) / N
+    d2 = (np.sum(S ** 2) - 2.0 * m * np.trace(S) + m ** 2 * N) / N
+    b2 = (np.sum(np.einsum('ij,ij->i', Deviation, Deviation) ** 2) / T
+          - np.sum(S ** 2)) / (N * T)
+    Shrinkage = min(b2, d2) / d2 if d2 > 0.0 else 1.0
+    Result = Covariance((1.0 - Shrinkage) * S
+                        + Shrinkage * m * np.identity(N))
+    Result.Shrinkage = Shrinkage
+    return Result
+
+
+def Statistical_Factor_Covariance(Return, K):
+    # Principal-component factor model: the K leading components of the
+    # sample covariance plus the residual variances.
+    Return = np.asarray(Return, dtype=float)
+    T = Return.shape[0]
+    Deviation = Return - Return.mean(axis=0)
+    U, s, Vt = la.svd(Deviation, full_matrices=False)
+    Loading = Vt[:K].T
+    Factor_Cov = np.diag(s[:K] ** 2 / T)
+    Specific = np.einsum('ij,ij->j', Deviation, Deviation) / T \
+               - np.einsum('ij,j,ij->i', Loading, np.diagonal(Factor_Cov),
+                           Loading)
+    return Factor_Covariance(Loading, Factor_Cov,
+                             np.maximum(Specific, 1e-12 * s[0] ** 2 / T))
@@ -0,0 +1,269 @@
+import numpy as np
+import scipy.linalg as la
+
+
+def Box_QP(Q, b, Total, Lower, Upper, Weight, Tol=1e-10, MaxIter=None):
+    # Primal active-set method for min 0.5 x'Qx + b'x subject to
+    # sum(x) = Total and Lower <= x <= Upper, from a feasible Weight.
+    # Returns the solution, its free set and the number of iterations.
+    n = b.shape[0]
+    x = Weight.copy()
+    Jitter = Tol * max(np.trace(Q) / n, 1.0)
+    Fixed = Upper - Lower <= Tol
+    Free = (x > Lower + Tol) & (x < Upper - Tol)
+    if not Free.any():
+        Free[np.argmax(np.where(Fixed, -np.inf,
+                                np.minimum(x - Lower, Upper - x)))] = True
+    MaxIter = 10 * n if MaxIter is None else MaxIter
+    for Iteration in range(1, MaxIter + 1):
+        F, B = np.flatnonzero(Free), np.flatnonzero(~Free)
+        Q_FF = Q[np.ix_(F, F)]
+        try:
+            Factor = la.cho_factor(Q_FF)
+        except la.LinAlgError:
+            Factor = la.cho_factor(Q_FF + Jitter * np.identity(F.shape[0]))
+        p, r = la.cho_solve(Factor, np.column_stack((
+            -(b[F] + Q[np.ix_(F, B)] @ x[B]), np.ones(F.shape[0])))).T
+        Gamma = (Total - x[B].sum() - p.sum()) / r.sum()
+        Direction = p + Gamma * r - x[F]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            Ratio = np.where(Direction < -Tol, (Lower[F] - x[F]) / Direction,
+                             np.where(Direction > Tol,
+                                      (Upper[F] - x[F]) / Direction, np.inf))
+        j = np.argmin(Ratio)
+        if Ratio[j] < 1.0:
+            x[F] += Ratio[j] * Direction
+            x[F[j]] = Lower[F[j]] if Direction[j] < 0.0 else Upper[F[j]]
+            Free[F[j]] = False
+            continue
+        x[F] += Direction
+        # A bound should be released when its multiplier has the wrong sign.
+        Multiplier = Q @ x + b - Gamma
+        Violation = np.where(x <= Lower + Tol, -Multiplier, Multiplier)
+        Violation[Free | Fixed] = 0.0
+        j = np.argmax(Violation)
+        if Violation[j] <= Tol:
+            break
+        Free[j] = True
+    return x, Free, Iteration
+
+
+def Critical_Line_Branch(Mu, Sigma, Lower, Upper, Tol, Refresh=200):
+    N = Mu.shape[0]
+    Weight = Lower.copy()
+    # Start from the maximum-return portfolio, the limit of the efficient
+    # portfolios as lambda grows: fill the levels of expected return from
+    # the top. Within the level where the budget runs out the weights
+    # minimize the variance; when the budget runs out exactly between two
+    # levels, the asset of the next level that enters first (the one with
+    # the least marginal variance) is the free one.
+    Budget = 1.0 - Lower.sum()
+    Free = None
+    for Level in np.unique(Mu)[::-1]:
+        T = np.flatnonzero((Mu == Level) & (Upper - Lower > Tol))
+        if T.shape[0] == 0:
+            continue
+        Capacity = (Upper[T] - Lower[T]).sum()
+        if Budget <= Tol:
+            Free = [T[np.argmin((Sigma @ Weight)[T])]]
+            break
+        if Budget > Capacity - Tol:
+            Weight[T] = Upper[T]
+            Budget -= Capacity
+            Last = T
+            continue
+        Start = Lower[T] + np.clip(Budget - np.r_[0.0, np.cumsum(
+            Upper[T] - Lower[T])[:-1]], 0.0, Upper[T] - Lower[T])
+        Other = np.setdiff1d(np.arange(N), T)
+        Weight[T], Free_T = Box_QP(Sigma[np.ix_(T, T)],
+                                   Sigma[np.ix_(T, Other)] @ Weight[Other],
+                                   Lower[T].sum() + Budget, Lower[T],
+                                   Upper[T], Start, Tol)[:2]
+        Free = list(T[Free_T])
+        break
+    if Free is None:
+        if Budget > Tol:
+            raise ValueError('the upper bounds sum to less than one')
+        Free = [Last[-1]]
+    V_Lambda = [np.inf]
+    V_Weight = [Weight.copy()]
+    Diagonal = np.diagonal(Sigma)
+    Full = np.zeros((N, 3))
+    # Sigma_inv[:f, :f] is the inverse of Sigma over the free assets and k
+    # holds the Schur complements of the bounded assets.  Both are updated
+    # by bordering between turning points, touching Sigma only through
+    # matrix-vector products, and are periodically rebuilt.
+    Sigma_inv = np.empty((N, N))
+    Step = 0
+    while True:
+        if Step % Refresh == 0:
+            F = np.array(Free)
+            Bnd = np.setdiff1d(np.arange(N), F)
+            f = F.shape[0]
+            Factor = la.cho_factor(Sigma[np.ix_(F, F)])
+            Sigma_inv[:f, :f] = la.cho_solve(Factor, np.identity(f))
+            Sigma_FB = Sigma[np.ix_(F, Bnd)]
+            k = Diagonal[Bnd] - np.einsum('ij,ij->j', Sigma_FB,
+                                          la.cho_solve(Factor, Sigma_FB))
+            Weight_B = Weight.copy()
+            Weight_B[F] = 0.0
+            Sigma_w = Sigma @ Weight_B
+            A = Sigma_inv[:f, :f] @ np.column_stack((np.ones(f), Mu[F],
+                                                     Sigma_w[F]))
+        Step += 1
+        F = np.array(Free)
+        Full[:] = 0.0
+        Full[F] = A
+        a1, a2, a3 = A.T
+        u1, u2, u3 = (Full.T @ Sigma)[:, Bnd]
+        c1, c3, l2 = a1.sum(), a2.sum(), a3.sum()
+        l1 = Weight[Bnd].sum()
+        Lambda_Current = V_Lambda[-1]
+        Ceiling = Lambda_Current - Tol * max(1.0, abs(Lambda_Current)) \
+                  if np.isfinite(Lambda_Current) else np.inf
+        # Case a): one free asset hits a bound.
+        Lambda_In, p_In, Bound_In = -np.inf, None, None
+        if f > 1:
+            c = c3 * a1 - c1 * a2
+            with np.errstate(divide='ignore', invalid='ignore'):
+                Bound = np.where(c > 0, Upper[F], Lower[F])
+                Lambda = ((1.0 - l1 + l2) * a1 - c1 * (Bound + a3)) / c
+            # A free asset whose weight does not move with lambda (c = 0)
+            # never reaches a bound.
+            Lambda[(np.abs(c) <= Tol) | ~(Lambda < Ceiling)] = -np.inf
+            # A degenerate free asset sitting on the bound it moves towards
+            # must be bounded at once.
+            Lambda[(np.abs(c) > Tol) & (np.abs(Weight[F] - Bound) <= Tol)] \
+                = Lambda_Current
+            p_In = np.argmax(Lambda)
+            Lambda_In, Bound_In = Lambda[p_In], Bound[p_In]
+        # Case b): one bounded asset becomes free, evaluated for every
+        # candidate at once by bordering Sigma_FF.  A candidate must move
+        # off its bound into the interior as lambda decreases.
+        Lambda_Out, q_Out = -np.inf, None
+        if Bnd.shape[0] > 0:
+            e1 = (1.0 - u1) / k
+            e2 = (Mu[Bnd] - u2) / k
+            e3 = (Sigma_w[Bnd] - u3) / k - Weight[Bnd]
+            c1_New = c1 + (1.0 - u1) * e1
+            c3_New = c3 + (1.0 - u1) * e2
+            l2_New = l2 - Weight[Bnd] * u1 + (1.0 - u1) * e3
+            l1_New = l1 - Weight[Bnd]
+            c = c3_New * e1 - c1_New * e2
+            # Freed at lambda, the candidate would move off its bound by
+            # (Numerator - lambda * c) / c1_New, with c1_New > 0.
+            Numerator = (1.0 - l1_New + l2_New) * e1 \
+                        - c1_New * (Weight[Bnd] + e3)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                Lambda = Numerator / c
+            At_Lower = Weight[Bnd] <= Lower[Bnd] + Tol
+            Inward = np.where(At_Lower, c > 0.0, c < 0.0)
+            Zero = np.abs(c) <= Tol
+            Lambda[Zero | (k <= Tol) | ~Inward | ~(Lambda < Ceiling)] = -np.inf
+            # With c = 0 the move does not depend on lambda: the candidate
+            # enters now if it moves inward, and otherwise never.
+            if np.isfinite(Lambda_Current):
+                Lambda[Zero & (k > Tol)
+                       & np.where(At_Lower, Numerator > Tol,
+                                  Numerator < -Tol)] = Lambda_Current
+            q_Out = np.argmax(Lambda)
+            Lambda_Out = Lambda[q_Out]
+        if max(Lambda_In, Lambda_Out) <= 0.0:
+            Lambda_New = 0.0
+        elif Lambda_In > Lambda_Out:
+            Lambda_New = Lambda_In
+            # Swap the leaving asset into the last free slot and drop it.
+            Last = f - 1
+            Sigma_inv[[p_In, Last], :f] = Sigma_inv[[Last, p_In], :f]
+            Sigma_inv[:f, [p_In, Last]] = Sigma_inv[:f, [Last, p_In]]
+            Free[p_In], Free[Last] = Free[Last], Free[p_In]
+            Full[:] = 0.0
+            Full[Free, 0] = Sigma_inv[Last, :f]
+            Pivot = Sigma_inv[Last, Last]
+            k += (Full[:, 0] @ Sigma)[Bnd] ** 2 / Pivot
+            Column = Sigma_inv[:Last, Last] / Pivot
+            Sigma_inv[:Last, :Last] -= np.outer(Column, Sigma_inv[Last, :Last])
+            i = Free.pop()
+            f = Last
+            k = np.r_[k, 1.0 / Pivot]
+            Bnd = np.r_[Bnd, i]
+            Weight[i] = Bound_In
+            Sigma_w += Sigma[:, i] * Bound_In
+        else:
+            Lambda_New = Lambda_Out
+            i, k_i = Bnd[q_Out], k[q_Out]
+            Keep = np.arange(Bnd.shape[0]) != q_Out
+            Bnd, k = Bnd[Keep], k[Keep]
+            u = Sigma_inv[:f, :f] @ Sigma[Free, i]
+            Full[:] = 0.0
+            Full[Free, 0] = u
+            e = (Sigma[i, Bnd] - (Full[:, 0] @ Sigma)[Bnd]) / k_i
+            k -= e ** 2 * k_i
+            Sigma_inv[:f, :f] += np.outer(u, u / k_i)
+            Sigma_inv[:f, f] = -u / k_i
+            Sigma_inv[f, :f] = -u / k_i
+            Sigma_inv[f, f] = 1.0 / k_i
+            f += 1
+            Free.append(i)
+            Sigma_w -= Sigma[:, i] * Weight[i]
+        F = np.array(Free)
+        A = Sigma_inv[:f, :f] @ np.column_stack((np.ones(f), Mu[F],
+                                                 Sigma_w[F]))
+        a1, a2, a3 = A.T
+        Gamma = (-Lambda_New * a2.sum() + 1.0 - Weight[Bnd].sum() + a3.sum()) \
+                / a1.sum()
+        Weight[F] = -a3 + Gamma * a1 + Lambda_New * a2
+        V_Lambda.append(Lambda_New)
+        V_Weight.append(Weight.copy())
+        if Lambda_New == 0.0:
+            break
+    return np.array(V_Lambda), np.array(V_Weight)
+
+
+def Critical_Line(Mu, Sigma, Lower=0.0, Upper=1.0, Inefficient=False,
+                  Tol=1e-10):
+    Mu = np.asarray(Mu, dtype=float)
+    Sigma = np.asarray(Sigma, dtype=float)
+    Lower = np.broadcast_to(np.asarray(Lower, dtype=float), Mu.shape).copy()
+    Upper = np.broadcast_to(np.asarray(Upper, dtype=float), Mu.shape).copy()
+    if Lower.sum() > 1.0 + Tol or Upper.sum() < 1.0 - Tol:
+        raise ValueError('the bounds admit no fully invested portfolio')
+    V_Weight = Critical_Line_Branch(Mu, Sigma, Lower, Upper, Tol)[1]
+    if Inefficient:
+        # The lower branch is the efficient frontier of -Mu.
+        V_Weight = np.vstack((Critical_Line_Branch(-Mu, Sigma, Lower, Upper,
+                                                   Tol)[1][::-1], V_Weight[1:]))
+    V_Return = V_Weight @ Mu
+    Order = np.argsort(V_Return, kind='stable')
+    V_Return, V_Weight = V_Return[Order], V_Weight[Order]
+    Keep = np.r_[True, np.diff(V_Return) > Tol * max(1.0, np.abs(Mu).max())]
+    return V_Return[Keep], V_Weight[Keep]
+
+
+def Critical_Line_Frontier(Turning_Return, Turning_Weight, Sigma, V_Target):
+    # Between two turning points the weights are linear in the target
+    # return, so the variance is a quadratic in the interpolation weight.
+    V_Target = np.asarray(V_Target, dtype=float)
+    Segment = np.clip(np.searchsorted(Turning_Return, V_Target) - 1, 0,
+                      max(Turning_Return.shape[0] - 2, 0))
+    if Turning_Return.shape[0] == 1:
+        V_Weight = np.tile(Turning_Weight[0], (V_Target.shape[0], 1))
+        return np.sqrt(Turning_Weight[0] @ Sigma @ Turning_Weight[0]) \
+               * np.ones(V_Target.shape), V_Weight
+    Start = Turning_Weight[:-1]
+    Delta = np.diff(Turning_Weight, axis=0)
+    SS = np.einsum('ij,ij->i', Start @ Sigma, Start)
+    SD = np.einsum('ij,ij->i', Start @ Sigma, Delta)
+    DD = np.einsum('ij,ij->i', Delta @ Sigma, Delta)
+    s = (V_Target - Turning_Return[Segment]) \
+        / np.diff(Turning_Return)[Segment]
+    Margin = 1e-9 * max(1.0, np.abs(Turning_Return).max())
+    Outside = (V_Target < Turning_Return[0] - Margin) \
+              | (V_Target > Turning_Return[-1] + Margin)
+    s = np.clip(s, 0.0, 1.0)
+    V_Risk = np.sqrt(np.maximum(SS[Segment] + 2.0 * s * SD[Segment]
+                                + s ** 2 * DD[Segment], 0.0))
+    V_Weight = Start[Segment] + s[:, np.newaxis] * Delta[Segment]
+    V_Risk[Outside] = np.nan
+    V_Weight[Outside] = np.nan
+    return V_Risk, V_Weight
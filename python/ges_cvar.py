@@ -0,0 +1,97 @@
+import numpy as np
+import scipy.optimize as opt
+
+
+def Portfolio_Return(Return, Weight, Chunk_Size):
+    return np.concatenate([np.asarray(Return[Start:(Start + Chunk_Size)],
+                                      dtype=float) @ Weight
+                           for Start in range(0, Return.shape[0], Chunk_Size)])
+
+
+def CVaR_Dual(Scenario, Mu, Target_Return, Alpha, T):
+    # Dual of the Rockafellar-Uryasev LP over the given scenarios, a
+    # problem with N + 1 rows and one bounded variable per scenario:
+    #   max a * Target_Return + b
+    #   s.t. Scenario'q + a * Mu + b <= 0, sum(q) = 1, 0 <= q <= 1/(Alpha*T).
+    # The weights are the duals of the N rows and VaR that of sum(q) = 1;
+    # the last value is the number of simplex iterations.
+    S, N = Scenario.shape
+    Result = opt.linprog(np.r_[np.zeros(S), -Target_Return, -1.0],
+                         A_ub=np.hstack((Scenario.T, Mu[:, np.newaxis],
+                                         np.ones((N, 1)))),
+                         b_ub=np.zeros(N),
+                         A_eq=np.r_[np.ones(S), 0.0, 0.0][np.newaxis, :],
+                         b_eq=np.ones(1),
+                         bounds=[(0.0, 1.0 / (Alpha * T))] * S
+                                + [(None, None)] * 2,
+                         method='highs-ds')
+    if Result.status != 0:
+        return None, np.nan, Result.nit
+    return np.maximum(-Result.ineqlin.marginals, 0.0), \
+           Result.eqlin.marginals[0], Result.nit
+
+
+def CVaR_Optimize(Return, Target_Return, Alpha, Mu=None, Active=None,
+                  Chunk_Size=100000, Tol=1e-9, MaxIter=100, Batch=None,
+                  Seed=0):
+    # Scenario generation: the LP is solved over an active set of
+    # scenarios that can be in the tail, and at most Batch (by default
+    # Alpha*T/2) of the scenarios outside it that fall furthest below
+    # VaR are added per round, until none does. Without an active set,
+    # the first one is the tail of the optimum over a random tenth of the
+    # scenarios. Portfolio returns are scanned in chunks, so Return may
+    # be a memory-mapped array. Rounds counts the LP solves and Iterations
+    # their simplex iterations.
+    T, N = Return.shape
+    if Mu is None:
+        Mu = sum(np.asarray(Return[Start:(Start + Chunk_Size)]).sum(axis=0)
+                 for Start in range(0, T, Chunk_Size)) / T
+    Batch = max(N, int(np.ceil(0.5 * Alpha * T))) if Batch is None else Batch
+    Rounds, Iterations = 0, 0
+    if Active is None:
+        Size = min(T, max(20 * N, int(np.ceil(0.1 * T))))
+        Sample = np.sort(np.random.default_rng(Seed).choice(T, Size,
+                                                            replace=False))
+        Weight, _, Count = CVaR_Dual(np.asarray(Return[Sample], dtype=float),
+                                     Mu, Target_Return, Alpha, Size)
+        Rounds, Iterations = Rounds + 1, Iterations + Count
+        if Weight is None:
+            Weight = np.full(N, 1.0 / N)
+        Portfolio = Portfolio_Return(Return, Weight, Chunk_Size)
+        Size = min(T, int(np.ceil(1.5 * Alpha * T)) + N)
+        Active = np.sort(np.argpartition(Portfolio, Size - 1)[:Size])
+    for Iteration in range(MaxIter):
+        Weight, VaR, Count = CVaR_Dual(np.asarray(Return[Active], dtype=float),
+                                       Mu, Target_Return, Alpha, T)
+        Rounds, Iterations = Rounds + 1, Iterations + Count
+        if Weight is None:
+            return np.full(N, np.nan), np.nan, np.nan, Active, Rounds, \
+                   Iterations
+        Portfolio = Portfolio_Return(Return, Weight, Chunk_Size)
+        Gap = VaR - Portfolio
+        Gap[Active] = -np.inf
+        Tail = np.flatnonzero(Gap > Tol * max(1.0, abs(VaR)))
+        if Tail.shape[0] == 0:
+            break
+        if Tail.shape[0] > Batch:
+            Tail = Tail[np.argpartition(-Gap[Tail], Batch - 1)[:Batch]]
+        Active = np.union1d(Active, Tail)
+    ES = np.maximum(VaR - Portfolio, 0.0).sum() / (Alpha * T) - VaR
+    return Weight, VaR, ES, Active, Rounds, Iterations
+
+
+def CVaR_Frontier(Return, V_Target, Alpha, Mu=None, Chunk_Size=100000):
+    # The active set is carried from one target return to the next.
+    V_Target = np.asarray(V_Target, dtype=float)
+    V_Risk = np.zeros(V_Target.shape)
+    V_VaR = np.zeros(V_Target.shape)
+    V_Weight = np.zeros((V_Target.shape[0], Return.shape[1]))
+    V_Rounds = np.zeros(V_Target.shape, dtype=int)
+    V_Iterations = np.zeros(V_Target.shape, dtype=int)
+    Active = None
+    for idx in np.argsort(V_Target):
+        V_Weight[idx], V_VaR[idx], V_Risk[idx], Active, V_Rounds[idx], \
+            V_Iterations[idx] = CVaR_Optimize(Return, V_Target[idx], Alpha,
+                                              Mu=Mu, Active=Active,
+                                              Chunk_Size=Chunk_Size)
+    return V_Risk, V_VaR, V_Weight, V_Rounds, V_Iterations
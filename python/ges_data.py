@@ -0,0 +1,120 @@
+import os
+import numpy as np
+import pandas as pd
+
+Cache_Folder = '.ges_cache'
+
+
+def Cache_Paths(File, Folder=None):
+    Folder = os.path.join(os.path.dirname(os.path.abspath(File)),
+                          Cache_Folder) if Folder is None else Folder
+    Name = os.path.join(Folder, os.path.basename(File))
+    return Name + '.bin', Name + '.npz'
+
+
+def Source_Stamp(File):
+    Status = os.stat(File)
+    return np.array([Status.st_mtime_ns, Status.st_size], dtype=np.int64)
+
+
+def Read_CSV_Chunks(File, Chunk_Size=100000):
+    return pd.read_csv(File, index_col=0, chunksize=Chunk_Size)
+
+
+def Build_Cache(File, Folder=None, Chunk_Size=100000):
+    # One pass over the CSV writes the values as raw float64 rows and
+    # accumulates the mean and the centred cross-product matrix, merging
+    # chunk statistics pairwise to avoid cancellation.
+    Data_Path, Meta_Path = Cache_Paths(File, Folder)
+    os.makedirs(os.path.dirname(Data_Path), exist_ok=True)
+    Stamp = Source_Stamp(File)
+    # Temporary names are per process, so concurrent builds cannot clash.
+    Temp = '.{0}.tmp'.format(os.getpid())
+    # The columns come from the header, so a file without rows still has
+    # them.
+    Columns = pd.read_csv(File, index_col=0, nrows=0).columns.values.astype(str)
+    N = Columns.shape[0]
+    V_Index = [np.zeros(0, dtype=str)]
+    T, Mu, M2 = 0, np.zeros(N), np.zeros((N, N))
+    with open(Data_Path + Temp, 'wb') as Output:
+        for Chunk in Read_CSV_Chunks(File, Chunk_Size):
+            if Chunk.shape[0] == 0:
+                continue
+            Values = np.ascontiguousarray(Chunk.values, dtype=float)
+            Values.tofile(Output)
+            V_Index.append(Chunk.index.values.astype(str))
+            n = Values.shape[0]
+            Mu_Chunk = Values.mean(axis=0)
+            Deviation = Values - Mu_Chunk
+            Delta = Mu_Chunk - Mu
+            M2 = M2 + Deviation.T @ Deviation \
+                 + np.outer(Delta, Delta) * (T * n / (T + n))
+            Mu = Mu + Delta * (n / (T + n))
+            T += n
+    Index = np.concatenate(V_Index)
+    with open(Meta_Path + Temp, 'wb') as Output:
+        np.savez(Output, Stamp=Stamp, Shape=np.array([T, Columns.shape[0]]),
+                 Index=Index, Columns=Columns, Mu=Mu, M2=M2)
+    # The metadata goes last, so a matching stamp implies complete data.
+    os.replace(Data_Path + Temp, Data_Path)
+    os.replace(Meta_Path + Temp, Meta_Path)
+
+
+def Open_Cache(File, Folder=None, Chunk_Size=100000):
+    Data_Path, Meta_Path = Cache_Paths(File, Folder)
+    Meta = None
+    if os.path.exists(Meta_Path) and os.path.exists(Data_Path):
+        with np.load(Meta_Path) as Saved:
+            if np.array_equal(Saved['Stamp'], Source_Stamp(File)):
+                Meta = dict(Saved)
+    if Meta is None:
+        Build_Cache(File, Folder, Chunk_Size)
+        with np.load(Meta_Path) as Saved:
+            Meta = dict(Saved)
+    Shape = tuple(Meta['Shape'])
+    if Shape[0] == 0:
+        # An empty file cannot be memory-mapped.
+        Values = np.zeros(Shape)
+        Values.flags.writeable = False
+    else:
+        Values = np.memmap(Data_Path, dtype=float, mode='r', shape=Shape)
+    return Values, Meta
+
+
+def Data_Index(Index):
+    try:
+        return pd.to_datetime(Index, format='ISO8601')
+    except ValueError:
+        return pd.Index(Index)
+
+
+def Load_Data(File, Folder=None, Chunk_Size=100000):
+    # The frame wraps the read-only memory-mapped cache without a copy,
+    # so assigning into it (Data.iloc[0, 0] = x, Data.values[:] = x)
+    # raises a ValueError; edit Data.copy() instead.
+    Values, Meta = Open_Cache(File, Folder, Chunk_Size)
+    return pd.DataFrame(Values, index=Data_Index(Meta['Index']),
+                        columns=Meta['Columns'], copy=False)
+
+
+def Iterate_Data(File, Chunk_Size=100000, Folder=None):
+    Values, Meta = Open_Cache(File, Folder, Chunk_Size)
+    for Start in range(0, Values.shape[0], Chunk_Size):
+        Stop = Start + Chunk_Size
+        yield pd.DataFrame(Values[Start:Stop],
+                           index=Data_Index(Meta['Index'][Start:Stop]),
+                           columns=Meta['Columns'], copy=False)
+
+
+def Data_Statistics(File, Folder=None, Chunk_Size=100000):
+    # Sigma is the maximum-likelihood covariance matrix, divided by T.
+    Meta = Open_Cache(File, Folder, Chunk_Size)[1]
+    T, N = Meta['Shape']
+    if T == 0:
+        return T, np.full(N, np.nan), np.full((N, N), np.nan)
+    return T, Meta['Mu'], Meta['M2'] / T
+
+
+def Data_File(Name):
+    # Bundled data files live next to the modules, wherever they run from.
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), Name)
@@ -0,0 +1,128 @@
+import os
+import time
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from ges_cvar import CVaR_Frontier
+from ges_frontier import Risk_Model, Default_Solver
+from ges_result_cache import Hash_Key
+from ges_solver_metrics import Solver_Metrics
+
+ES_Engines = ('cvar', 'conic')
+
+Worker_Model = None
+Worker_Return = None
+Worker_Record = False
+
+
+def Initialize_Worker(Return, Record=False, Engine='cvar'):
+    global Worker_Model, Worker_Return, Worker_Record
+    Worker_Return, Worker_Record = Return, Record
+    Worker_Model = None if Engine == 'cvar' else \
+        Risk_Model('expected shortfall', Return=Return,
+                   Metrics=Solver_Metrics() if Record else None)
+
+
+def Solve_Chunk(Alpha, V_Target):
+    # Metrics recorded in a worker are handed back with the chunk.
+    if Worker_Model is None:
+        # The active-set CVaR engine carries its tail scenarios from one
+        # target to the next; its time is spread evenly over the chunk.
+        Start = time.perf_counter()
+        Risk, VaR, Weight, Rounds, Iterations = CVaR_Frontier(
+            Worker_Return, V_Target, Alpha)
+        Time = (time.perf_counter() - Start) / max(1, V_Target.shape[0])
+        Records = [dict(measure='expected shortfall', formulation='active set',
+                        solver='HIGHS', target=float(Target),
+                        status='optimal' if np.isfinite(Value)
+                        else 'infeasible', iterations=int(Count),
+                        rounds=int(Round), solver_time=Time, compile=0.0,
+                        update=0.0, solve=Time, unpack=0.0, residual=np.nan)
+                   for Target, Value, Count, Round in zip(V_Target, Risk,
+                                                          Iterations, Rounds)] \
+                  if Worker_Record else []
+        return Risk, Records
+    # A new alpha forces a recompile, so it is only set when it changes.
+    if Worker_Model.inv_Alpha.value != 1.0 / Alpha:
+        Worker_Model.Set_Alpha(Alpha)
+    Risk = np.array([Worker_Model.Solve(Target)[0] for Target in V_Target])
+    Records = []
+    if Worker_Model.Metrics is not None:
+        Records = Worker_Model.Metrics.Records
+        Worker_Model.Metrics.Clear()
+    return Risk, Records
+
+
+def Load_Checkpoint(Checkpoint, V_Alpha, V_Target, Key):
+    # Key identifies the returns and the solver the points came from.
+    V_Risk = np.full((V_Target.shape[0], V_Alpha.shape[0]), np.nan)
+    Done = np.zeros(V_Risk.shape, dtype=bool)
+    if Checkpoint is not None and os.path.exists(Checkpoint):
+        with np.load(Checkpoint) as Saved:
+            if not (np.array_equal(Saved['V_Alpha'], V_Alpha)
+                    and np.array_equal(Saved['V_Target'], V_Target)):
+                raise ValueError('checkpoint {0} was written for a different '
+                                 'grid'.format(Checkpoint))
+            if 'Key' not in Saved or str(Saved['Key']) != Key:
+                raise ValueError('checkpoint {0} was written for different '
+                                 'returns or solver'.format(Checkpoint))
+            V_Risk, Done = Saved['V_Risk'], Saved['Done']
+    return V_Risk, Done
+
+
+def Save_Checkpoint(Checkpoint, V_Alpha, V_Target, V_Risk, Done, Key):
+    with open(Checkpoint + '.tmp', 'wb') as File:
+        np.savez(File, V_Alpha=V_Alpha, V_Target=V_Target, V_Risk=V_Risk,
+                 Done=Done, Key=np.array(Key))
+    os.replace(Checkpoint + '.tmp', Checkpoint)
+
+
+def ES_Frontier_Grid(Return, V_Alpha, V_Target, Workers=None, Chunk_Size=50,
+                     Checkpoint=None, Metrics=None, Engine='cvar'):
+    # Engine 'cvar' uses the active-set LP of ges_cvar, 'conic' the
+    # compiled Risk_Model with one deviation per scenario.
+    if Engine not in ES_Engines:
+        raise ValueError('unknown ES engine: {0}'.format(Engine))
+    Return = np.asarray(Return, dtype=float)
+    V_Alpha = np.asarray(V_Alpha, dtype=float)
+    V_Target = np.asarray(V_Target, dtype=float)
+    Key = Hash_Key(Return, Engine, Default_Solver['expected shortfall']
+                   if Engine == 'conic' else 'HIGHS')
+    V_Risk, Done = Load_Checkpoint(Checkpoint, V_Alpha, V_Target, Key)
+    Tasks = []
+    for idx_col in range(V_Alpha.shape[0]):
+        Pending = np.flatnonzero(~Done[:, idx_col])
+        for Start in range(0, Pending.shape[0], Chunk_Size):
+            Tasks.append((idx_col, Pending[Start:(Start + Chunk_Size)]))
+    Workers = os.cpu_count() if Workers is None else Workers
+
+    def Collect(idx_col, idx_row, Result):
+        Risk, Records = Result
+        if Metrics is not None:
+            for Record in Records:
+                Record['alpha'] = float(V_Alpha[idx_col])
+            Metrics.Merge(Records)
+        V_Risk[idx_row, idx_col] = Risk
+        Done[idx_row, idx_col] = True
+        if Checkpoint is not None:
+            Save_Checkpoint(Checkpoint, V_Alpha, V_Target, V_Risk, Done, Key)
+
+    if Workers <= 1 or len(Tasks) <= 1:
+        Initialize_Worker(Return, Metrics is not None, Engine)
+        for idx_col, idx_row in Tasks:
+            Collect(idx_col, idx_row, Solve_Chunk(V_Alpha[idx_col],
+                                                  V_Target[idx_row]))
+    else:
+        with ProcessPoolExecutor(max_workers=Workers,
+                                 initializer=Initialize_Worker,
+                                 initargs=(Return, Metrics is not None,
+                                           Engine)) \
+                as Executor:
+            Futures = {Executor.submit(Solve_Chunk, V_Alpha[idx_col],
+                                       V_Target[idx_row]): (idx_col, idx_row)
+                       for idx_col, idx_row in Tasks}
+            for Future in as_completed(Futures):
+                Collect(*Futures[Future], Future.result())
+    return pd.DataFrame(V_Risk,
+                        index=pd.Index(V_Target, name='target return'),
+                        columns=pd.Index(V_Alpha, name='alpha'))
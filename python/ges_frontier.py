@@ -0,0 +1,233 @@
+import time
+import numpy as np
+import scipy.linalg as la
+import scipy.sparse as sp
+import cvxpy as cp
+from ges_covariance import Covariance, Factor_Covariance
+
+Risk_Measures = ('variance', 'semivariance', 'absolute deviation',
+                 'expected shortfall')
+Default_Solver = {'variance': cp.ECOS,
+                  'semivariance': cp.ECOS,
+                  'absolute deviation': cp.ECOS,
+                  'expected shortfall': cp.ECOS}
+
+
+def Set_Default_Solver(Choice):
+    # Choice maps risk measures to solvers; models compiled afterwards use
+    # them unless a solver is passed explicitly.
+    Unknown = set(Choice) - set(Risk_Measures)
+    if Unknown:
+        raise ValueError('unknown risk measures: {0}'
+                         .format(', '.join(sorted(Unknown))))
+    Default_Solver.update(Choice)
+
+
+def Variance_Factors(Mu, Sigma, Return):
+    # Matrices G with w'Sigma w = sum(||G w||^2).
+    if Return is not None:
+        T = Return.shape[0]
+        return [la.qr((Return - Mu) / np.sqrt(T), mode='r')[0]]
+    if isinstance(Sigma, Factor_Covariance):
+        Factor = la.cholesky(Sigma.Factor_Cov, lower=True)
+        return [(Sigma.Loading @ Factor).T, sp.diags(np.sqrt(Sigma.Specific))]
+    Sigma = Sigma if isinstance(Sigma, Covariance) else Covariance(Sigma)
+    try:
+        return [np.triu(Sigma.Cholesky()[0].T)]
+    except la.LinAlgError:
+        Value, Vector = la.eigh(Sigma.Dense())
+        return [np.sqrt(np.maximum(Value, 0.0))[:, np.newaxis] * Vector.T]
+
+
+class Risk_Model:
+    def __init__(self, Measure, Mu=None, Sigma=None, Return=None, Alpha=0.05,
+                 Short_Selling=False, Metrics=None):
+        if Measure not in Risk_Measures:
+            raise ValueError('unknown risk measure: {0}'.format(Measure))
+        if Return is not None:
+            Return = np.asarray(Return, dtype=float)
+            T, N = Return.shape
+            Mu = Return.mean(axis=0) if Mu is None else np.asarray(Mu)
+        elif Measure == 'variance' and Sigma is not None:
+            N = Sigma.N if isinstance(Sigma, Covariance) else Sigma.shape[0]
+        else:
+            raise ValueError('{0} requires a return matrix'.format(Measure))
+        self.Measure = Measure
+        self.Mu = Mu
+        self.Weight = cp.Variable(N)
+        self.Target_Return = cp.Parameter()
+        self.inv_Alpha = cp.Parameter(nonneg=True, value=1.0 / Alpha)
+        Constraints = [self.Weight.T @ Mu == self.Target_Return,
+                       cp.sum(self.Weight) == 1.0]
+        if not Short_Selling:
+            Constraints.append(self.Weight >= 0.0)
+        if Measure == 'variance':
+            # The variance only needs a square root of Sigma: an N x N
+            # Cholesky (or QR) factor, or the O(NK) factor-model terms,
+            # instead of one deviation per scenario.
+            self.Formulation = 'factor' if isinstance(Sigma, Factor_Covariance) \
+                               and Return is None else 'cholesky'
+            self.Risk = sum(cp.sum_squares(G @ self.Weight)
+                            for G in Variance_Factors(Mu, Sigma, Return))
+        else:
+            # These measures keep the original formulation, one deviation
+            # per scenario, and no cheaper equivalent is implemented: unlike
+            # variance they stay O(T) in size, and at T=2500, N=500 a
+            # semivariance or absolute deviation solve still takes about a
+            # minute. Only exactly repeated scenarios (bootstrapped or
+            # discretized returns) are merged, each row weighted by its
+            # count; continuous returns almost never repeat.
+            Unique, Count = np.unique(Return, axis=0, return_counts=True)
+            if Unique.shape[0] < T:
+                Return = Unique
+                self.Formulation = 'merged scenario'
+            else:
+                Count = np.ones(T)
+                self.Formulation = 'scenario'
+            Deviation = cp.Variable(Return.shape[0])
+        if Measure == 'semivariance':
+            self.Risk = cp.sum_squares(Deviation)
+            Constraints += [Deviation >= 0.0,
+                            np.sqrt(Count / T)[:, np.newaxis] * (Return - Mu)
+                            @ self.Weight + Deviation >= 0.0]
+        elif Measure == 'absolute deviation':
+            self.Risk = cp.norm(Deviation, 1)
+            Constraints.append((Count / T)[:, np.newaxis] * (Return - Mu)
+                               @ self.Weight == Deviation)
+        elif Measure == 'expected shortfall':
+            VaR = cp.Variable()
+            self.Risk = cp.sum(Deviation) * self.inv_Alpha - VaR
+            Constraints += [Deviation >= 0.0,
+                            (Count / T)[:, np.newaxis] * Return @ self.Weight
+                            - VaR * Count / T + Deviation >= 0.0]
+        self.Problem = cp.Problem(cp.Minimize(self.Risk), Constraints)
+        Size = self.Problem.size_metrics
+        self.Size = (Size.num_scalar_variables,
+                     Size.num_scalar_eq_constr + Size.num_scalar_leq_constr)
+        self.Solver = None
+        self.Solves = 0
+        self.Metrics = Metrics
+        self.Compile_Time = 0.0
+
+    def Set_Alpha(self, Alpha):
+        self.inv_Alpha.value = 1.0 / Alpha
+        self.Solver = None
+
+    def Compile(self, Solver=None):
+        # The target return enters the solver data affinely, so the data at
+        # two targets gives every other target without recanonicalizing.
+        Solver = Default_Solver[self.Measure] if Solver is None else Solver
+        Start = time.perf_counter()
+        self.Target_Return.value = 0.0
+        self.Data, self.Chain, self.Inverse_Data = \
+            self.Problem.get_problem_data(Solver)
+        self.Target_Return.value = 1.0
+        Data = self.Problem.get_problem_data(Solver)[0]
+        self.Data_Slope = {Key: Data[Key] - Value
+                           for Key, Value in self.Data.items()
+                           if isinstance(Value, np.ndarray)
+                           and Value.dtype.kind == 'f'
+                           and np.any(Data[Key] != Value)}
+        self.Solver = Solver
+        # Charged to the next solve when metrics are recorded.
+        self.Compile_Time += time.perf_counter() - Start
+
+    def Solve(self, Target_Return, Solver=None, Warm_Start=True):
+        if self.Solver is None or (Solver is not None and Solver != self.Solver):
+            self.Compile(Solver)
+        Time = [time.perf_counter()]
+        self.Target_Return.value = Target_Return
+        Data = dict(self.Data)
+        for Key, Slope in self.Data_Slope.items():
+            Data[Key] = self.Data[Key] + Target_Return * Slope
+        Time.append(time.perf_counter())
+        Status = None
+        try:
+            # A fresh options dict each call: some solver interfaces write
+            # their defaults into it, which would leak into other solvers.
+            Solution = self.Chain.solve_via_data(self.Problem, Data, Warm_Start,
+                                                 solver_opts={})
+            Time.append(time.perf_counter())
+            self.Problem.unpack_results(Solution, self.Chain, self.Inverse_Data)
+            Time.append(time.perf_counter())
+            Status = self.Problem.status
+        except cp.error.SolverError:
+            Status = 'solver_error'
+        finally:
+            self.Solves += 1
+            if self.Metrics is not None:
+                self.Record_Metrics(Target_Return, Status, Time)
+        if Status not in (cp.OPTIMAL, cp.OPTIMAL_INACCURATE):
+            return np.nan, np.full(self.Weight.shape, np.nan)
+        Risk = self.Risk.value
+        if self.Measure in ('variance', 'semivariance'):
+            Risk = np.sqrt(max(Risk, 0.0))
+        return Risk, self.Weight.value
+
+    def Record_Metrics(self, Target_Return, Status, Time):
+        Time = Time + [np.nan] * (4 - len(Time))
+        Solved = Status in (cp.OPTIMAL, cp.OPTIMAL_INACCURATE)
+        Stats = self.Problem.solver_stats if Solved else None
+        self.Metrics.Record(
+            measure=self.Measure, formulation=self.Formulation,
+            solver=self.Solver, target=float(Target_Return),
+            status=Status,
+            iterations=getattr(Stats, 'num_iters', None),
+            solver_time=getattr(Stats, 'solve_time', None),
+            compile=self.Compile_Time, update=Time[1] - Time[0],
+            solve=Time[2] - Time[1], unpack=Time[3] - Time[2],
+            residual=max(float(np.max(Constraint.violation()))
+                         for Constraint in self.Problem.constraints)
+                     if Solved else np.nan)
+        self.Compile_Time = 0.0
+
+
+def Frontier_Sweep(Model, V_Target, Solver=None, Warm_Start=True,
+                   Report=False):
+    V_Target = np.asarray(V_Target, dtype=float)
+    V_Risk = np.zeros(V_Target.shape)
+    V_Weight = np.zeros((V_Target.shape[0], Model.Weight.shape[0]))
+    for idx in np.argsort(V_Target):
+        V_Risk[idx], V_Weight[idx, :] = Model.Solve(V_Target[idx], Solver,
+                                                    Warm_Start)
+    if Report and Model.Metrics is not None:
+        Model.Metrics.Report()
+    return V_Risk, V_Weight
+
+
+def Adaptive_Frontier(Model, Lower=None, Upper=None, Tol=1e-3, Initial=9,
+                      Max_Points=250, Solver=None, Warm_Start=True,
+                      Report=False):
+    Lower = Model.Mu.min() if Lower is None else Lower
+    Upper = Model.Mu.max() if Upper is None else Upper
+    V_Target = np.linspace(Lower, Upper, num=Initial)
+    V_Risk, V_Weight = Frontier_Sweep(Model, V_Target, Solver, Warm_Start)
+    while V_Target.shape[0] < Max_Points:
+        # Bisect the intervals whose midpoint error under linear
+        # interpolation, estimated from divided differences, exceeds Tol.
+        Valid = np.isfinite(V_Risk)
+        x, y = V_Target[Valid], V_Risk[Valid]
+        if x.shape[0] < 3:
+            break
+        Slope = np.diff(y) / np.diff(x)
+        Curvature = np.abs(np.diff(Slope)) / (x[2:] - x[:-2])
+        Curvature = np.maximum(np.r_[Curvature[0], Curvature],
+                               np.r_[Curvature, Curvature[-1]])
+        Error = Curvature * np.diff(x) ** 2 / 4.0
+        Scale = max(y.max() - y.min(), np.finfo(float).eps)
+        Refine = np.flatnonzero(Error > Tol * Scale)
+        Refine = Refine[:Max_Points - V_Target.shape[0]]
+        if Refine.size == 0:
+            break
+        New_Target = 0.5 * (x[Refine] + x[Refine + 1])
+        New_Risk, New_Weight = Frontier_Sweep(Model, New_Target, Solver,
+                                              Warm_Start)
+        V_Target = np.r_[V_Target, New_Target]
+        V_Risk = np.r_[V_Risk, New_Risk]
+        V_Weight = np.vstack((V_Weight, New_Weight))
+        Order = np.argsort(V_Target)
+        V_Target, V_Risk, V_Weight = V_Target[Order], V_Risk[Order], \
+                                     V_Weight[Order]
+    if Report and Model.Metrics is not None:
+        Model.Metrics.Report()
+    return V_Target, V_Risk, V_Weight
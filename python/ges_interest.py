@@ -1,18 +1,30 @@
 import numpy as np
-import matplotlib.pyplot as plt
-r = 0.2
-Maturity = 10
-Simple_Rate = 1.0 + r * np.linspace(0, Maturity, Maturity + 1)
-Compound_1year = np.hstack((1.0, np.cumprod(np.tile(1.0 + r, Maturity))))
-Compound_6month = np.hstack((1.0, np.cumprod(np.tile((1.0 + r/2.0)**2, Maturity))))
-Continuous_Rate = np.exp(r*np.linspace(0, Maturity, Maturity + 1))
-fig1 = plt.figure(num=1, facecolor='w')
-plt.plot(Simple_Rate, 'b-')
-plt.plot(Compound_1year, 'r--')
-plt.plot(Compound_6month, 'g-.')
-plt.plot(Continuous_Rate, 'm:')
-plt.legend(['simple', '1-year compound', '6-month compound', 'continuous'],
-           loc='upper left', frameon=False)
-plt.xlabel('t')
-plt.ylabel('W(t)/W(0)')
-plt.show()
+
+
+def Analysis(r=0.2, Maturity=10):
+    Simple_Rate = 1.0 + r * np.linspace(0, Maturity, Maturity + 1)
+    Compound_1year = np.hstack((1.0, np.cumprod(np.tile(1.0 + r, Maturity))))
+    Compound_6month = np.hstack((1.0, np.cumprod(np.tile((1.0 + r/2.0)**2,
+                                                         Maturity))))
+    Continuous_Rate = np.exp(r*np.linspace(0, Maturity, Maturity + 1))
+    return {'Simple_Rate': Simple_Rate, 'Compound_1year': Compound_1year,
+            'Compound_6month': Compound_6month,
+            'Continuous_Rate': Continuous_Rate}
+
+
+def Plot(Result):
+    import matplotlib.pyplot as plt
+    plt.figure(num=1, facecolor='w')
+    plt.plot(Result['Simple_Rate'], 'b-')
+    plt.plot(Result['Compound_1year'], 'r--')
+    plt.plot(Result['Compound_6month'], 'g-.')
+    plt.plot(Result['Continuous_Rate'], 'm:')
+    plt.legend(['simple', '1-year compound', '6-month compound', 'continuous'],
+               loc='upper left', frameon=False)
+    plt.xlabel('t')
+    plt.ylabel('W(t)/W(0)')
+    plt.show()
+
+
+if __name__ == '__main__':
+    Plot(Analysis())
@@ -1,6 +1,5 @@
 import numpy as np
-import numpy.linalg as la
-import matplotlib.pyplot as plt
+from ges_covariance import Correlation_Covariance
 Mu = np.array([1.0, 3.0, 1.5, 6.0, 4.5])
 Stdev = np.array([5.0, 10.0, 7.5, 15.0, 11.0])
 CorrMatrix = np.array([[1.00, 0.25, 0.18, 0.10, 0.25],
@@ -8,30 +7,45 @@ CorrMatrix = np.array([[1.00, 0.25, 0.18, 0.10, 0.25],
                        [0.18, 0.36, 1.00, 0.25, 0.36],
                        [0.10, 0.20, 0.25, 1.00, 0.45],
                        [0.25, 0.20, 0.36, 0.45, 1.00]])
-Sigma = np.diag(Stdev) @ CorrMatrix @ np.diag(Stdev)
-iota = np.ones(Mu.shape)
-inv_Sigma = la.inv(Sigma)
-A = Mu @ inv_Sigma @ iota
-B = Mu @ inv_Sigma @ Mu
-C = iota @ inv_Sigma @ iota
-D = B * C - A ** 2
-V_Target = np.linspace(Mu.min(), Mu.max(), num=5)
-V_Risk = np.zeros(V_Target.shape)
-V_Weight = np.zeros((V_Target.shape[0], Mu.shape[0]))
-for idx, Target_Return in enumerate(V_Target):
-    V_Weight[idx, :] = (C * Target_Return - A) / D * la.solve(Sigma, Mu) \
-                       + (B - A * Target_Return) / D * la.solve(Sigma, iota)
-    V_Risk[idx] = (C / D) * (Target_Return - A / C) ** 2 + 1.0 / C
-sigma_gmv = 1.0 / np.sqrt(C)
-sigma_p = np.linspace(sigma_gmv, 1.05 * np.max(Stdev), num=250)
-mu_p_efficient = (A + np.sqrt(np.abs(C * sigma_p ** 2 - 1.0) * D)) / C
-mu_p_inefficient = (A - np.sqrt(np.abs(C * sigma_p ** 2 - 1.0) * D)) / C
-fig1 = plt.figure(1, facecolor='w')
-plt.plot(sigma_p, mu_p_efficient, 'b-')
-plt.plot(sigma_p, mu_p_inefficient, 'b:')
-plt.plot(np.sqrt(np.diagonal(Sigma)), Mu, 'rx')
-plt.legend(['efficient frontier', 'inefficient frontier', 'asset'],
-           loc='best', frameon=False)
-plt.xlabel('standard deviation (%)')
-plt.ylabel('expected return (%)')
-plt.show()
+
+
+def Analysis():
+    Cov = Correlation_Covariance(Stdev, CorrMatrix)
+    Sigma = Cov.Dense()
+    iota = np.ones(Mu.shape)
+    A = Cov.Inverse_Quad_Form(Mu, iota)
+    B = Cov.Inverse_Quad_Form(Mu)
+    C = Cov.Inverse_Quad_Form(iota)
+    D = B * C - A ** 2
+    V_Target = np.linspace(Mu.min(), Mu.max(), num=5)
+    V_Risk = np.zeros(V_Target.shape)
+    V_Weight = np.zeros((V_Target.shape[0], Mu.shape[0]))
+    for idx, Target_Return in enumerate(V_Target):
+        V_Weight[idx, :] = (C * Target_Return - A) / D * Cov.Solve(Mu) \
+                           + (B - A * Target_Return) / D * Cov.Solve(iota)
+        V_Risk[idx] = (C / D) * (Target_Return - A / C) ** 2 + 1.0 / C
+    sigma_gmv = 1.0 / np.sqrt(C)
+    sigma_p = np.linspace(sigma_gmv, 1.05 * np.max(Stdev), num=250)
+    mu_p_efficient = (A + np.sqrt(np.abs(C * sigma_p ** 2 - 1.0) * D)) / C
+    mu_p_inefficient = (A - np.sqrt(np.abs(C * sigma_p ** 2 - 1.0) * D)) / C
+    return {'Sigma': Sigma, 'V_Target': V_Target, 'V_Risk': V_Risk,
+            'V_Weight': V_Weight, 'sigma_p': sigma_p,
+            'mu_p_efficient': mu_p_efficient,
+            'mu_p_inefficient': mu_p_inefficient}
+
+
+def Plot(Result):
+    import matplotlib.pyplot as plt
+    plt.figure(1, facecolor='w')
+    plt.plot(Result['sigma_p'], Result['mu_p_efficient'], 'b-')
+    plt.plot(Result['sigma_p'], Result['mu_p_inefficient'], 'b:')
+    plt.plot(np.sqrt(np.diagonal(Result['Sigma'])), Mu, 'rx')
+    plt.legend(['efficient frontier', 'inefficient frontier', 'asset'],
+               loc='best', frameon=False)
+    plt.xlabel('standard deviation (%)')
+    plt.ylabel('expected return (%)')
+    plt.show()
+
+
+if __name__ == '__main__':
+    Plot(Analysis())
@@ -1,7 +1,6 @@
 import numpy as np
-import numpy.linalg as la
-import cvxpy as cp
-import matplotlib.pyplot as plt
+from ges_covariance import Correlation_Covariance
+from ges_critical_line import Critical_Line, Critical_Line_Frontier
 Mu = np.array([1.0, 3.0, 1.5, 6.0, 4.5])
 Stdev = np.array([5.0, 10.0, 7.5, 15.0, 11.0])
 CorrMatrix = np.array([[1.00, 0.25, 0.18, 0.10, 0.25],
@@ -9,49 +8,55 @@ CorrMatrix = np.array([[1.00, 0.25, 0.18, 0.10, 0.25],
                        [0.18, 0.36, 1.00, 0.25, 0.36],
                        [0.10, 0.20, 0.25, 1.00, 0.45],
                        [0.25, 0.20, 0.36, 0.45, 1.00]])
-Sigma = np.diag(Stdev) @ CorrMatrix @ np.diag(Stdev)
-iota = np.ones(Mu.shape)
-inv_Sigma = la.inv(Sigma)
-A = Mu @ inv_Sigma @ iota
-B = Mu @ inv_Sigma @ Mu
-C = iota @ inv_Sigma @ iota
-D = B * C - A ** 2
-Weight = cp.Variable(Mu.shape[0])
-Target_Return = cp.Parameter(nonneg=True)
-Risk_Variance = cp.quad_form(Weight, Sigma)
-Opt_Portfolio = cp.Problem(cp.Minimize(Risk_Variance),
-                           [Weight.T @ Mu == Target_Return,
-                            cp.sum(Weight) == 1.0,
-                            Weight >= 0.0])
-V_Target = np.linspace(Mu.min(), Mu.max(), num=250)
-V_Risk = np.zeros(V_Target.shape)
-V_Weight = np.zeros((V_Target.shape[0], Mu.shape[0]))
-for idx, Target_Return.value in enumerate(V_Target):
-    Opt_Portfolio.solve(solver=cp.ECOS)
-    V_Weight[idx, :] = Weight.value.T
-    V_Risk[idx] = np.sqrt(Risk_Variance.value)
-sigma_gmv = 1.0 / np.sqrt(C)
-sigma_p = np.linspace(sigma_gmv, 1.05 * np.max(Stdev), num=250)
-mu_p_efficient = (A + np.sqrt(np.abs(C * sigma_p ** 2 - 1.0) * D)) / C
-fig1 = plt.figure(num=1, facecolor='w')
-plt.plot(sigma_p, mu_p_efficient, 'b-')
-plt.plot(V_Risk, V_Target, 'g:')
-plt.plot(np.sqrt(np.diagonal(Sigma)), Mu, 'rx')
-plt.legend(['efficient frontier with short selling',
-            'efficient frontier without short selling',
-            'asset'],
-           loc='best',  frameon=False)
-plt.xlabel('standard deviation (%)')
-plt.ylabel('expected return (%)')
-plt.show()
-fig2 = plt.figure(num=2, facecolor='w')
-plt.stackplot(V_Target, V_Weight.T*100,
-              colors=tuple([tuple(gray*np.ones(3))
-                            for gray in np.linspace(0.4, 0.8, num=Mu.shape[0])
-                            ]))
-plt.axis([Mu.min(), Mu.max(), 0.0, 100.0])
-plt.legend(['asset 1', 'asset 2', 'asset 3', 'asset 4', 'asset 5'],
-           loc='upper left', bbox_to_anchor=(1.0, 1.0), frameon=False)
-plt.xlabel('target expected return (%)')
-plt.ylabel('allocation weight (%)')
-plt.show()
+
+
+def Analysis():
+    Cov = Correlation_Covariance(Stdev, CorrMatrix)
+    Sigma = Cov.Dense()
+    iota = np.ones(Mu.shape)
+    A = Cov.Inverse_Quad_Form(Mu, iota)
+    B = Cov.Inverse_Quad_Form(Mu)
+    C = Cov.Inverse_Quad_Form(iota)
+    D = B * C - A ** 2
+    Turning_Return, Turning_Weight = Critical_Line(Mu, Sigma, Inefficient=True)
+    V_Target = np.linspace(Mu.min(), Mu.max(), num=250)
+    V_Risk, V_Weight = Critical_Line_Frontier(Turning_Return, Turning_Weight,
+                                              Sigma, V_Target)
+    sigma_gmv = 1.0 / np.sqrt(C)
+    sigma_p = np.linspace(sigma_gmv, 1.05 * np.max(Stdev), num=250)
+    mu_p_efficient = (A + np.sqrt(np.abs(C * sigma_p ** 2 - 1.0) * D)) / C
+    return {'Sigma': Sigma, 'Turning_Return': Turning_Return,
+            'Turning_Weight': Turning_Weight, 'V_Target': V_Target,
+            'V_Risk': V_Risk, 'V_Weight': V_Weight, 'sigma_p': sigma_p,
+            'mu_p_efficient': mu_p_efficient}
+
+
+def Plot(Result):
+    import matplotlib.pyplot as plt
+    V_Target = Result['V_Target']
+    plt.figure(num=1, facecolor='w')
+    plt.plot(Result['sigma_p'], Result['mu_p_efficient'], 'b-')
+    plt.plot(Result['V_Risk'], V_Target, 'g:')
+    plt.plot(np.sqrt(np.diagonal(Result['Sigma'])), Mu, 'rx')
+    plt.legend(['efficient frontier with short selling',
+                'efficient frontier without short selling',
+                'asset'],
+               loc='best',  frameon=False)
+    plt.xlabel('standard deviation (%)')
+    plt.ylabel('expected return (%)')
+    plt.show()
+    plt.figure(num=2, facecolor='w')
+    plt.stackplot(V_Target, Result['V_Weight'].T*100,
+                  colors=tuple([tuple(gray*np.ones(3))
+                                for gray in np.linspace(0.4, 0.8,
+                                                        num=Mu.shape[0])]))
+    plt.axis([Mu.min(), Mu.max(), 0.0, 100.0])
+    plt.legend(['asset 1', 'asset 2', 'asset 3', 'asset 4', 'asset 5'],
+               loc='upper left', bbox_to_anchor=(1.0, 1.0), frameon=False)
+    plt.xlabel('target expected return (%)')
+    plt.ylabel('allocation weight (%)')
+    plt.show()
+
+
+if __name__ == '__main__':
+    Plot(Analysis())
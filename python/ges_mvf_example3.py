@@ -1,30 +1,29 @@
 import numpy as np
-import cvxpy as cp
-import pandas as pd
-import matplotlib.pyplot as plt
-R = pd.read_csv('asset_return_data.csv', index_col=0)
-T, N = R.shape
-Mu = R.mean().values
-Sigma = R.cov().values * ((T - 1.0) / T)
-Return_Dev = (R - Mu).values / np.sqrt(T)
-Weight = cp.Variable(N)
-Deviation = cp.Variable(T)
-Target_Return = cp.Parameter(nonneg=True)
-Risk_Variance = cp.sum_squares(Deviation)
-Opt_Portfolio = cp.Problem(cp.Minimize(Risk_Variance),
-                           [Return_Dev @ Weight == Deviation,
-                            Weight.T @ Mu == Target_Return,
-                            cp.sum(Weight) == 1.0,
-                            Weight >= 0.0])
-V_Target = np.linspace(Mu.min(), Mu.max(), num=250)
-V_Risk = np.zeros(V_Target.shape)
-for idx, Target_Return.value in enumerate(V_Target):
-    Opt_Portfolio.solve(solver=cp.ECOS)
-    V_Risk[idx] = np.sqrt(Risk_Variance.value)
-fig1 = plt.figure(num=1, facecolor='w')
-plt.plot(V_Risk, V_Target, 'b-')
-plt.plot(np.sqrt(np.diagonal(Sigma)), Mu, 'rx')
-plt.legend(['frontier', 'asset'], loc='best', frameon=False)
-plt.xlabel('standard deviation (%)')
-plt.ylabel('expected return (%)')
-plt.show()
+from ges_data import Load_Data, Data_Statistics, Data_File
+from ges_frontier import Risk_Model, Adaptive_Frontier
+from ges_result_cache import Memoize
+
+
+@Memoize(Files=('File',), Solvers=('variance',))
+def Analysis(File=Data_File('asset_return_data.csv')):
+    R = Load_Data(File)
+    T, Mu, Sigma = Data_Statistics(File)
+    Opt_Portfolio = Risk_Model('variance', Return=R.values)
+    V_Target, V_Risk, V_Weight = Adaptive_Frontier(Opt_Portfolio)
+    return {'Mu': Mu, 'Asset_Risk': np.sqrt(np.diagonal(Sigma)),
+            'V_Target': V_Target, 'V_Risk': V_Risk, 'V_Weight': V_Weight}
+
+
+def Plot(Result):
+    import matplotlib.pyplot as plt
+    plt.figure(num=1, facecolor='w')
+    plt.plot(Result['V_Risk'], Result['V_Target'], 'b-')
+    plt.plot(Result['Asset_Risk'], Result['Mu'], 'rx')
+    plt.legend(['frontier', 'asset'], loc='best', frameon=False)
+    plt.xlabel('standard deviation (%)')
+    plt.ylabel('expected return (%)')
+    plt.show()
+
+
+if __name__ == '__main__':
+    Plot(Analysis())
@@ -0,0 +1,84 @@
+import numpy as np
+from scipy.special import ndtr, bdtrc
+
+
+def Black_Scholes(S, K, r, v, T, Call=True):
+    S, K, r, v, T = (np.asarray(x, dtype=float) for x in (S, K, r, v, T))
+    # Puts use the call formulas with the signs of d1 and d2 flipped, so
+    # every price and Greek comes from two CDF and one PDF evaluation.
+    Sign = np.where(Call, 1.0, -1.0)
+    Root_T = np.sqrt(T)
+    Vol = v * Root_T
+    d1 = (np.log(S / K) + (r + 0.5 * v ** 2) * T) / Vol
+    d2 = d1 - Vol
+    N1 = ndtr(Sign * d1)
+    N2 = ndtr(Sign * d2)
+    pdf1 = np.exp(-0.5 * d1 ** 2) / np.sqrt(2.0 * np.pi)
+    K_Discount = K * np.exp(-r * T)
+    Price = Sign * (S * N1 - K_Discount * N2)
+    Delta = Sign * N1
+    Gamma = pdf1 / (S * Vol)
+    Vega = S * pdf1 * Root_T
+    Theta = -0.5 * S * pdf1 * v / Root_T - Sign * r * K_Discount * N2
+    Rho = Sign * T * K_Discount * N2
+    return Price[()], Delta[()], Gamma[()], Vega[()], Theta[()], Rho[()]
+
+
+def Binomial_European(S, K, u, f, N, Call=True):
+    # Closed-form sum over the terminal nodes: the option finishes in the
+    # money when the number of upticks reaches a threshold, so the price is
+    # two binomial tail probabilities (Cox-Ross-Rubinstein).
+    S, K, u, f = (np.asarray(x, dtype=float) for x in (S, K, u, f))
+    q = (f - 1.0 / u) / (u - 1.0 / u)
+    Log_u = np.log(u)
+    Threshold = np.clip(np.ceil((np.log(K / S) + N * Log_u) / (2.0 * Log_u)),
+                        0.0, N + 1.0)
+    K_Discount = K * f ** -N
+    Call_Price = S * bdtrc(np.minimum(Threshold - 1.0, N), N, q * u / f) \
+                 - K_Discount * bdtrc(np.minimum(Threshold - 1.0, N), N, q)
+    Price = np.where(Call, Call_Price, Call_Price - S + K_Discount)
+    return Price[()]
+
+
+def Binomial_Lattice(S, K, u, f, N, Call=False, American=True,
+                     Boundary=False):
+    # Roll back a batch of N-step lattices in one preallocated buffer. Only
+    # the terminal prices are generated; dividing them by u steps them back
+    # one level, where node j of level n is S * u ** (n - 2 * j).
+    if Boundary and not American:
+        raise ValueError('a European option has no early-exercise boundary')
+    S, K, u, f, Call = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (S, K, u, f, Call)))
+    Shape = S.shape
+    S, K, u, f = (x.reshape(-1, 1) for x in (S, K, u, f))
+    Sign = np.where(Call.reshape(-1, 1) > 0.0, 1.0, -1.0)
+    q = (f - 1.0 / u) / (u - 1.0 / u)
+    Up, Down = q / f, (1.0 - q) / f
+    Price = S * u ** (N - 2.0 * np.arange(N + 1))
+    Premium = np.maximum(Sign * (Price - K), 0.0)
+    Work = np.empty(Premium.shape)
+    V_Boundary = np.full((S.shape[0], N + 1), np.nan) if Boundary else None
+    if Boundary:
+        V_Boundary[:, N] = K[:, 0]
+    for n in range(N - 1, -1, -1):
+        Level = slice(0, n + 1)
+        np.multiply(Down, Premium[:, 1:(n + 2)], out=Work[:, Level])
+        Premium[:, Level] *= Up
+        Premium[:, Level] += Work[:, Level]
+        if American:
+            Price[:, Level] /= u
+            np.subtract(Price[:, Level], K, out=Work[:, Level])
+            Work[:, Level] *= Sign
+            if Boundary:
+                Exercise = Work[:, Level] > Premium[:, Level]
+            np.maximum(Premium[:, Level], Work[:, Level],
+                       out=Premium[:, Level])
+            if Boundary:
+                # Calls are exercised above the boundary, puts below it.
+                Node = np.where(Exercise, Sign * Price[:, Level], np.inf)
+                V_Boundary[:, n] = Sign[:, 0] * Node.min(axis=1)
+    Premium = Premium[:, 0].reshape(Shape)[()]
+    if Boundary:
+        V_Boundary[np.isinf(V_Boundary)] = np.nan
+        return Premium, V_Boundary.reshape(Shape + (N + 1,))
+    return Premium
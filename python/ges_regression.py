@@ -0,0 +1,72 @@
+import numpy as np
+import scipy.linalg as la
+
+
+def Design_Matrix(X, Intercept=True):
+    X = np.asarray(X, dtype=float)
+    X = X.reshape(X.shape[0], -1)
+    if Intercept:
+        X = np.column_stack((np.ones(X.shape[0]), X))
+    return X
+
+
+def Regression_Statistics(Coef, XtX_inv, Cross, YtY, Sum_Y, T):
+    # All statistics follow from the cross-product matrices: at the least
+    # squares solution the residual sum of squares is Y'Y - b'X'Y.
+    p = Coef.shape[0]
+    RSS = np.maximum(YtY - np.einsum('ij,ij->j', Coef, Cross), 0.0)
+    TSS = YtY - Sum_Y ** 2 / T
+    Sigma2 = RSS / (T - p)
+    StdErr = np.sqrt(np.outer(np.diagonal(XtX_inv), Sigma2))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        R2 = 1.0 - RSS / TSS
+    return StdErr, R2, Sigma2
+
+
+def Factor_Regression(Y, X, Intercept=True):
+    Y = np.asarray(Y, dtype=float)
+    Y = Y.reshape(Y.shape[0], -1)
+    D = Design_Matrix(X, Intercept)
+    T = D.shape[0]
+    Q, R = la.qr(D, mode='economic')
+    QtY = Q.T @ Y
+    Coef = la.solve_triangular(R, QtY)
+    R_inv = la.solve_triangular(R, np.identity(R.shape[0]))
+    YtY = np.einsum('ij,ij->j', Y, Y)
+    StdErr, R2, Sigma2 = Regression_Statistics(Coef, R_inv @ R_inv.T,
+                                               D.T @ Y, YtY, Y.sum(axis=0), T)
+    return Coef, StdErr, R2, Sigma2
+
+
+def Rolling_Regression(Y, X, Window, Intercept=True, Refresh=None):
+    Y = np.asarray(Y, dtype=float)
+    Y = Y.reshape(Y.shape[0], -1)
+    D = Design_Matrix(X, Intercept)
+    T, M = Y.shape
+    p = D.shape[1]
+    Steps = T - Window + 1
+    Refresh = Window if Refresh is None else Refresh
+    V_Coef = np.zeros((Steps, p, M))
+    V_StdErr = np.zeros((Steps, p, M))
+    V_R2 = np.zeros((Steps, M))
+    V_Sigma2 = np.zeros((Steps, M))
+    for Start in range(Steps):
+        if Start % Refresh == 0:
+            Rows = slice(Start, Start + Window)
+            XtX = D[Rows].T @ D[Rows]
+            Cross = D[Rows].T @ Y[Rows]
+            YtY = np.einsum('ij,ij->j', Y[Rows], Y[Rows])
+            Sum_Y = Y[Rows].sum(axis=0)
+        else:
+            # Slide the window by one row: add the new one, drop the old one.
+            Add, Drop = Start + Window - 1, Start - 1
+            XtX += np.outer(D[Add], D[Add]) - np.outer(D[Drop], D[Drop])
+            Cross += np.outer(D[Add], Y[Add]) - np.outer(D[Drop], Y[Drop])
+            YtY += Y[Add] ** 2 - Y[Drop] ** 2
+            Sum_Y += Y[Add] - Y[Drop]
+        Factor = la.cho_factor(XtX)
+        XtX_inv = la.cho_solve(Factor, np.identity(p))
+        V_Coef[Start] = XtX_inv @ Cross
+        V_StdErr[Start], V_R2[Start], V_Sigma2[Start] = Regression_Statistics(
+            V_Coef[Start], XtX_inv, Cross, YtY, Sum_Y, Window)
+    return V_Coef, V_StdErr, V_R2, V_Sigma2
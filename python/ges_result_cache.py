@@ -0,0 +1,255 @@
+import functools
+import hashlib
+import importlib
+import inspect
+import os
+import pickle
+import sys
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from ges_covariance import Covariance, Factor_Covariance
+from ges_data import Cache_Folder, Source_Stamp, Data_File
+
+
+def Hash_Update(Hash, Value):
+    # Every value is fed in with its type tag, so that for example 1 and
+    # 1.0, or a list and a tuple of the same items, hash differently.
+    if isinstance(Value, Factor_Covariance):
+        Hash.update(b'factor covariance')
+        for x in (Value.Loading, Value.Factor_Cov, Value.Specific):
+            Hash_Update(Hash, x)
+    elif isinstance(Value, Covariance):
+        Hash.update(b'covariance')
+        Hash_Update(Hash, Value.Dense())
+    elif isinstance(Value, (pd.DataFrame, pd.Series)):
+        Hash.update(type(Value).__name__.encode())
+        Hash_Update(Hash, Value.values)
+        Hash_Update(Hash, Value.index)
+        if isinstance(Value, pd.DataFrame):
+            Hash_Update(Hash, Value.columns)
+    elif isinstance(Value, pd.Index):
+        Hash.update(b'index')
+        Hash_Update(Hash, np.asarray(Value.astype(str)).astype('U'))
+    elif isinstance(Value, (np.ndarray, np.generic)):
+        Value = np.ascontiguousarray(Value)
+        if Value.dtype.hasobject:
+            Value = Value.astype('U')
+        Hash.update('{0}{1}'.format(Value.dtype.str, Value.shape).encode())
+        Hash.update(Value.tobytes())
+    elif isinstance(Value, (list, tuple)):
+        Hash.update('{0}{1}'.format(type(Value).__name__, len(Value)).encode())
+        for x in Value:
+            Hash_Update(Hash, x)
+    elif isinstance(Value, dict):
+        Hash.update('dict{0}'.format(len(Value)).encode())
+        for Key in sorted(Value, key=repr):
+            Hash_Update(Hash, Key)
+            Hash_Update(Hash, Value[Key])
+    elif Value is None or isinstance(Value, (bool, int, float, complex, str,
+                                             bytes)):
+        Hash.update('{0}:{1!r}'.format(type(Value).__name__, Value).encode())
+    else:
+        raise TypeError('cannot hash a {0} for the result cache'
+                        .format(type(Value).__name__))
+
+
+def Hash_Key(*Values):
+    Hash = hashlib.sha256()
+    for Value in Values:
+        Hash_Update(Hash, Value)
+    return Hash.hexdigest()
+
+
+class Result_Cache:
+    # Results are held pickled, both in a small in-memory LRU and in one
+    # file per key on disk, so every hit returns an independent copy.
+    def __init__(self, Folder=None, Capacity=32, Max_Bytes=2 ** 28):
+        self.Folder = Folder
+        self.Capacity = Capacity
+        self.Max_Bytes = Max_Bytes
+        self.Memory = OrderedDict()
+        self.Hits = {'memory': 0, 'disk': 0, 'miss': 0}
+
+    def Path(self, Key):
+        return os.path.join(self.Folder, Key + '.pkl')
+
+    def Get(self, Key):
+        if Key in self.Memory:
+            self.Memory.move_to_end(Key)
+            self.Hits['memory'] += 1
+            return True, pickle.loads(self.Memory[Key])
+        if self.Folder is not None and os.path.exists(self.Path(Key)):
+            try:
+                with open(self.Path(Key), 'rb') as File:
+                    Data = File.read()
+                Value = pickle.loads(Data)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                Value = None
+            else:
+                # The modification time orders the files for eviction.
+                os.utime(self.Path(Key))
+                self.Remember(Key, Data)
+                self.Hits['disk'] += 1
+                return True, Value
+        self.Hits['miss'] += 1
+        return False, None
+
+    def Put(self, Key, Value):
+        Data = pickle.dumps(Value, protocol=pickle.HIGHEST_PROTOCOL)
+        self.Remember(Key, Data)
+        if self.Folder is not None:
+            os.makedirs(self.Folder, exist_ok=True)
+            Temp = self.Path(Key) + '.{0}.tmp'.format(os.getpid())
+            with open(Temp, 'wb') as File:
+                File.write(Data)
+            os.replace(Temp, self.Path(Key))
+            self.Evict()
+
+    def Remember(self, Key, Data):
+        self.Memory[Key] = Data
+        self.Memory.move_to_end(Key)
+        while len(self.Memory) > self.Capacity:
+            self.Memory.popitem(last=False)
+
+    def Evict(self):
+        # Drop the least recently used files until the folder fits.
+        Files = []
+        for Entry in os.scandir(self.Folder):
+            if Entry.name.endswith('.pkl'):
+                Status = Entry.stat()
+                Files.append((Status.st_mtime_ns, Status.st_size, Entry.path))
+        Files.sort()
+        Total = sum(Size for _, Size, _ in Files)
+        for _, Size, Path in Files[:-1]:
+            if Total <= self.Max_Bytes:
+                break
+            try:
+                os.remove(Path)
+            except FileNotFoundError:
+                pass
+            Total -= Size
+
+    def Clear(self):
+        self.Memory.clear()
+        if self.Folder is not None and os.path.isdir(self.Folder):
+            for Entry in os.scandir(self.Folder):
+                if Entry.name.endswith('.pkl'):
+                    os.remove(Entry.path)
+
+
+Default_Cache = Result_Cache(os.path.join(Data_File(Cache_Folder), 'results'))
+
+
+def Source_Fingerprint(Modules):
+    # A hash of the source of the given modules and of every module in
+    # this folder they reach through their globals, so that editing the
+    # code behind a result invalidates it.
+    Folder = os.path.dirname(os.path.abspath(__file__))
+    Stack = list(Modules)
+    Seen = set()
+    while Stack:
+        Module = Stack.pop()
+        Path = getattr(Module, '__file__', None)
+        if Path is None or not Path.endswith('.py'):
+            continue
+        Path = os.path.abspath(Path)
+        if Path in Seen or os.path.dirname(Path) != Folder:
+            continue
+        Seen.add(Path)
+        for Value in vars(Module).values():
+            if inspect.ismodule(Value):
+                Stack.append(Value)
+            elif isinstance(getattr(Value, '__module__', None), str):
+                Stack.append(sys.modules.get(Value.__module__))
+    Hash = hashlib.sha256()
+    for Path in sorted(Seen):
+        Hash.update(os.path.basename(Path).encode())
+        with open(Path, 'rb') as File:
+            Hash.update(File.read())
+    return Hash.hexdigest()
+
+
+def Memoize(Files=(), Ignore=(), Cache=None, Modules=(), Solvers=()):
+    # Cache a function on a hash of its name, its code and its bound
+    # arguments. The code is the source fingerprint of the function's
+    # module and of the modules named in Modules (for imports made inside
+    # the function). The arguments named in Files are data files: their
+    # modification time and size enter the key, so editing a file
+    # invalidates its results. Arguments named in Ignore (worker counts
+    # and the like) do not. Solvers names the risk measures whose default
+    # solver the function uses, so that changing it is a different key.
+    def Decorator(Function):
+        Signature = inspect.signature(Function)
+        Name = Function.__module__ + '.' + Function.__qualname__
+        Fingerprint = []
+
+        @functools.wraps(Function)
+        def Wrapper(*Args, **Kwargs):
+            if not Fingerprint:
+                Fingerprint.append(Source_Fingerprint(
+                    [sys.modules[Function.__module__]]
+                    + [importlib.import_module(x) for x in Modules]))
+            Bound = Signature.bind(*Args, **Kwargs)
+            Bound.apply_defaults()
+            Arguments = {Key: Value for Key, Value in Bound.arguments.items()
+                         if Key not in Ignore}
+            Stamps = {Key: (os.path.abspath(Arguments[Key]),
+                            Source_Stamp(Arguments[Key]))
+                      for Key in Files}
+            Solver = {}
+            if Solvers:
+                from ges_frontier import Default_Solver
+                Solver = {Measure: Default_Solver[Measure]
+                          for Measure in Solvers}
+            Key = Hash_Key(Name, Fingerprint[0], Arguments, Stamps, Solver)
+            Store = Default_Cache if Cache is None else Cache
+            Found, Value = Store.Get(Key)
+            if not Found:
+                Value = Function(*Args, **Kwargs)
+                Store.Put(Key, Value)
+            return Value
+        Wrapper.Uncached = Function
+        return Wrapper
+    return Decorator
+
+
+@Memoize(Modules=('ges_frontier',))
+def Frontier_Result(Measure, Return, Mu, Sigma, Alpha, Short_Selling,
+                    V_Target, Solver):
+    from ges_frontier import Risk_Model, Frontier_Sweep, Adaptive_Frontier
+    Model = Risk_Model(Measure, Mu=Mu, Sigma=Sigma, Return=Return, Alpha=Alpha,
+                       Short_Selling=Short_Selling)
+    if V_Target is None:
+        return Adaptive_Frontier(Model, Solver=Solver)
+    return (V_Target,) + Frontier_Sweep(Model, V_Target, Solver)
+
+
+def Cached_Frontier(Measure, Return=None, Mu=None, Sigma=None, Alpha=0.05,
+                    Short_Selling=False, V_Target=None, Solver=None):
+    # Returns (V_Target, V_Risk, V_Weight), adaptive when V_Target is None.
+    # The solver is resolved first, so that changing the default solver
+    # does not return results computed with the old one.
+    from ges_frontier import Default_Solver
+    Solver = Default_Solver[Measure] if Solver is None else Solver
+    if V_Target is not None:
+        V_Target = np.asarray(V_Target, dtype=float)
+    return Frontier_Result(Measure, None if Return is None
+                           else np.asarray(Return, dtype=float),
+                           Mu, Sigma, Alpha, Short_Selling, V_Target, Solver)
+
+
+def Cached_ES_Frontier_Grid(Return, V_Alpha, V_Target, Workers=None,
+                            Chunk_Size=50):
+    from ges_es_scenario import ES_Frontier_Grid
+    return Memoize(Ignore=('Workers', 'Chunk_Size'),
+                   Solvers=('expected shortfall',))(ES_Frontier_Grid)(
+        np.asarray(Return, dtype=float), np.asarray(V_Alpha, dtype=float),
+        np.asarray(V_Target, dtype=float), Workers, Chunk_Size)
+
+
+def Cached_Bootstrap_Curve(Price, Maturity, CouponRate, FaceValue=100.0,
+                           Frequency=1, Interpolation='log-linear'):
+    from ges_yield_curve import Bootstrap_Curve
+    return Memoize()(Bootstrap_Curve)(Price, Maturity, CouponRate, FaceValue,
+                                      Frequency, Interpolation)
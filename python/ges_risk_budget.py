@@ -0,0 +1,115 @@
+import numpy as np
+import scipy.linalg as la
+
+
+def Risk_Contribution(Weight, Sigma):
+    Sigma_w = np.einsum('...ij,...j->...i', Sigma, Weight)
+    Contribution = Weight * Sigma_w
+    return Contribution / Contribution.sum(axis=-1, keepdims=True)
+
+
+def Risk_Budget_Objective(y, Sigma, Budget):
+    Sigma_y = np.einsum('...ij,...j->...i', Sigma, y)
+    return 0.5 * (y * Sigma_y).sum(axis=-1) \
+           - (Budget * np.log(y)).sum(axis=-1), Sigma_y
+
+
+def Coordinate_Descent(y, Sigma, Budget, Sweeps, Tol=1e-8):
+    # Cyclical coordinate descent on the same objective: coordinate i
+    # solves Sigma_ii y_i^2 + c_i y_i - b_i = 0 exactly, with
+    # c_i = (Sigma y)_i - Sigma_ii y_i, and Sigma y is updated in O(N), so
+    # a sweep costs O(N^2). It stops once the residual max|y Sigma y - b|
+    # (relative to the budgets) falls below Tol or a sweep after the first
+    # fails to halve it, as happens when a few strong factors couple all
+    # the assets. Unless it cut the residual tenfold, the starting point
+    # is returned: Newton does better from there.
+    N = Sigma.shape[-1]
+    Diagonal = np.diagonal(Sigma, axis1=-2, axis2=-1)
+    Start = y
+    y = y.copy()
+    Sigma_y = np.einsum('...ij,...j->...i', Sigma, y)
+    Residual = Initial = np.abs(y * Sigma_y - Budget).max() / Budget.max()
+    for Sweep in range(Sweeps):
+        if Residual <= Tol:
+            break
+        if Sigma.ndim == 2:
+            # Scalar arithmetic is much cheaper than 0-d array operations.
+            for i in range(N):
+                d, b, c = Diagonal[i], Budget[i], Sigma_y[i] - Diagonal[i] * y[i]
+                Root = np.sqrt(c * c + 4.0 * d * b)
+                # The larger root, without cancellation when c > 0.
+                y_i = 2.0 * b / (c + Root) if c > 0.0 else (Root - c) / (2.0 * d)
+                Sigma_y += Sigma[i] * (y_i - y[i])
+                y[i] = y_i
+        else:
+            for i in range(N):
+                d, b = Diagonal[..., i], Budget[..., i]
+                c = Sigma_y[..., i] - d * y[..., i]
+                Root = np.sqrt(c * c + 4.0 * d * b)
+                y_i = np.where(c > 0.0, 2.0 * b / (c + Root),
+                               (Root - c) / (2.0 * d))
+                Sigma_y += Sigma[..., i, :] * (y_i - y[..., i])[..., np.newaxis]
+                y[..., i] = y_i
+        Previous = Residual
+        Residual = np.abs(y * Sigma_y - Budget).max() / Budget.max()
+        if Sweep > 0 and Residual > 0.5 * Previous:
+            break
+    return Start if Residual > 0.1 * Initial else y
+
+
+def Risk_Budget(Sigma, Budget=None, Weight=None, Tol=1e-16, MaxIter=100,
+                Sweeps=50):
+    # Damped Newton on the convex problem
+    #   min 0.5 y'Sigma y - sum(Budget * log(y)),
+    # whose minimizer, rescaled to sum to one, has risk contributions
+    # proportional to Budget. Leading axes of Sigma are solved as a batch.
+    # Up to Sweeps rounds of coordinate descent, O(N^2) each, come first,
+    # so Newton, at O(N^3) a step, only has to finish.
+    Sigma = np.asarray(Sigma, dtype=float)
+    N = Sigma.shape[-1]
+    Budget = np.full(N, 1.0 / N) if Budget is None else \
+             np.asarray(Budget, dtype=float)
+    Budget = np.broadcast_to(Budget / Budget.sum(axis=-1, keepdims=True),
+                             Sigma.shape[:-1])
+    if Weight is None:
+        Weight = Budget / np.sqrt(np.diagonal(Sigma, axis1=-2, axis2=-1))
+    Weight = np.broadcast_to(np.asarray(Weight, dtype=float), Budget.shape)
+    # Along the ray through Weight the objective is minimized at this scale.
+    Scale = np.sqrt(Budget.sum(axis=-1) / np.einsum(
+        '...i,...ij,...j->...', Weight, Sigma, Weight))
+    y = Weight * Scale[..., np.newaxis]
+    if Sweeps > 0:
+        y = Coordinate_Descent(y, Sigma, Budget, Sweeps)
+    Diagonal = np.arange(N)
+    Objective, Sigma_y = Risk_Budget_Objective(y, Sigma, Budget)
+    for Iteration in range(1, MaxIter + 1):
+        Gradient = Sigma_y - Budget / y
+        Hessian = Sigma.copy()
+        Hessian[..., Diagonal, Diagonal] += Budget / y ** 2
+        if Hessian.ndim == 2:
+            Direction = -la.cho_solve(la.cho_factor(Hessian, overwrite_a=True),
+                                      Gradient)
+        else:
+            Direction = -np.linalg.solve(Hessian,
+                                         Gradient[..., np.newaxis])[..., 0]
+        Decrement = -(Gradient * Direction).sum(axis=-1)
+        # Converged problems still take their last, full Newton step.
+        Converged = Decrement <= Tol
+        # Stay inside the positive orthant, then backtrack to sufficient
+        # decrease.
+        with np.errstate(divide='ignore'):
+            Ratio = np.where(Direction < 0.0, -y / Direction, np.inf)
+        Step = np.minimum(1.0, 0.99 * Ratio.min(axis=-1))
+        while True:
+            y_New = y + Step[..., np.newaxis] * Direction
+            Objective_New, Sigma_y_New = Risk_Budget_Objective(y_New, Sigma,
+                                                               Budget)
+            Fail = ~Converged & (Objective_New
+                                 > Objective - 0.25 * Step * Decrement)
+            if not Fail.any() or np.where(Fail, Step, 0.0).max() < 1e-12:
+                break
+            Step = np.where(Fail, 0.5 * Step, Step)
+        y, Sigma_y, Objective = y_New, Sigma_y_New, Objective_New
+        if Converged.all():
+            break
+    return y / y.sum(axis=-1, keepdims=True), Iteration
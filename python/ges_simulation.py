@@ -0,0 +1,78 @@
+import os
+from collections import deque
+import numpy as np
+import scipy.linalg as la
+from concurrent.futures import ProcessPoolExecutor
+
+Worker_Mu = None
+Worker_L = None
+
+
+def Initialize_Worker(Mu, L):
+    global Worker_Mu, Worker_L
+    Worker_Mu, Worker_L = Mu, L
+
+
+def Simulate_Chunk(Seed, Size):
+    Z = np.random.default_rng(Seed).standard_normal((Size, Worker_Mu.shape[0]))
+    return Z @ Worker_L.T + Worker_Mu
+
+
+def Write_Chunk(Output, Start, Seed, Size):
+    Sample = np.load(Output, mmap_mode='r+')
+    Sample[Start:(Start + Size)] = Simulate_Chunk(Seed, Size)
+    Sample.flush()
+
+
+def Simulation_Plan(T, Seed, Chunk_Size):
+    # Every chunk has its own spawned stream, so the sample depends only on
+    # the seed and the chunk size, not on how chunks are spread over workers.
+    V_Start = np.arange(0, T, Chunk_Size)
+    V_Seed = np.random.SeedSequence(Seed).spawn(V_Start.shape[0])
+    return [(Start, min(Chunk_Size, T - Start), Seed)
+            for Start, Seed in zip(V_Start, V_Seed)]
+
+
+def Iterate_Simulation(Mu, Sigma, T, Seed=None, Chunk_Size=100000, Workers=1):
+    Mu = np.asarray(Mu, dtype=float)
+    L = la.cholesky(np.asarray(Sigma, dtype=float), lower=True)
+    Plan = Simulation_Plan(T, Seed, Chunk_Size)
+    Workers = os.cpu_count() if Workers is None else Workers
+    if Workers <= 1 or len(Plan) <= 1:
+        Initialize_Worker(Mu, L)
+        for Start, Size, Chunk_Seed in Plan:
+            yield Simulate_Chunk(Chunk_Seed, Size)
+        return
+    with ProcessPoolExecutor(max_workers=Workers, initializer=Initialize_Worker,
+                             initargs=(Mu, L)) as Executor:
+        # Keep a bounded number of chunks in flight and yield them in order.
+        Pending = deque()
+        for Start, Size, Chunk_Seed in Plan:
+            Pending.append(Executor.submit(Simulate_Chunk, Chunk_Seed, Size))
+            if len(Pending) >= 2 * Workers:
+                yield Pending.popleft().result()
+        while Pending:
+            yield Pending.popleft().result()
+
+
+def Simulate_Returns(Mu, Sigma, T, Output, Seed=None, Chunk_Size=100000,
+                     Workers=1):
+    Mu = np.asarray(Mu, dtype=float)
+    L = la.cholesky(np.asarray(Sigma, dtype=float), lower=True)
+    np.lib.format.open_memmap(Output, mode='w+', dtype=float,
+                              shape=(T, Mu.shape[0])).flush()
+    Plan = Simulation_Plan(T, Seed, Chunk_Size)
+    Workers = os.cpu_count() if Workers is None else Workers
+    if Workers <= 1 or len(Plan) <= 1:
+        Initialize_Worker(Mu, L)
+        for Start, Size, Chunk_Seed in Plan:
+            Write_Chunk(Output, Start, Chunk_Seed, Size)
+    else:
+        with ProcessPoolExecutor(max_workers=Workers,
+                                 initializer=Initialize_Worker,
+                                 initargs=(Mu, L)) as Executor:
+            for Future in [Executor.submit(Write_Chunk, Output, Start,
+                                           Chunk_Seed, Size)
+                           for Start, Size, Chunk_Seed in Plan]:
+                Future.result()
+    return np.load(Output, mmap_mode='r')
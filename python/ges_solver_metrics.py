@@ -0,0 +1,89 @@
+import json
+import numpy as np
+import pandas as pd
+
+Phases = ('compile', 'update', 'solve', 'unpack')
+Solved = ('optimal', 'optimal_inaccurate')
+
+
+class Solver_Metrics:
+    def __init__(self):
+        self.Records = []
+
+    def Record(self, **Fields):
+        self.Records.append(Fields)
+
+    def Merge(self, Records):
+        self.Records.extend(Records)
+
+    def Clear(self):
+        self.Records = []
+
+    def Table(self):
+        return pd.DataFrame(self.Records)
+
+    def Save_CSV(self, Path):
+        self.Table().to_csv(Path, index=False)
+
+    def Save_JSON(self, Path):
+        # NaN is not valid JSON, so missing values are written as null.
+        Records = [{Key: None if isinstance(Value, float) and np.isnan(Value)
+                    else Value for Key, Value in Record.items()}
+                   for Record in self.Records]
+        with open(Path, 'w') as File:
+            json.dump(Records, File, indent=2)
+
+    def Summary(self, By=('measure', 'solver')):
+        Table = self.Table()
+        if Table.empty:
+            return Table
+        Table['failed'] = ~Table['status'].isin(Solved)
+        Table['inaccurate'] = Table['status'] == 'optimal_inaccurate'
+        Table['iterations'] = pd.to_numeric(Table['iterations'])
+        Group = Table.groupby(list(By))
+        Result = pd.concat((Group.size().rename('solves'),
+                            Group[['failed', 'inaccurate']].sum(),
+                            Group['iterations'].mean(),
+                            Group[list(Phases)].sum(),
+                            Group['residual'].max()), axis=1)
+        Result['time per solve'] = Result[list(Phases)].sum(axis=1) \
+                                   / Result['solves']
+        return Result
+
+    def Report(self, By=('measure', 'solver')):
+        Result = self.Summary(By)
+        if Result.empty:
+            return
+        with pd.option_context('display.width', 200,
+                               'display.max_columns', None,
+                               'display.float_format', '{:.4g}'.format):
+            print(Result)
+
+    def Fastest_Solver(self):
+        # For each measure, the solver with the least time per solve among
+        # those that solved every problem they were given.
+        Result = self.Summary(('measure', 'solver'))
+        Result = Result[Result['failed'] == 0]
+        Choice = {}
+        for (Measure, Solver), Time in Result['time per solve'].items():
+            if Measure not in Choice or Time < Result.loc[(Measure,
+                                                            Choice[Measure]),
+                                                           'time per solve']:
+                Choice[Measure] = Solver
+        return Choice
+
+
+def Profile_Solvers(Model, V_Target, Solvers, Metrics=None):
+    # Sweep the same targets with each solver, recompiling for each one.
+    from ges_frontier import Frontier_Sweep
+    Metrics = Solver_Metrics() if Metrics is None else Metrics
+    Previous = Model.Metrics
+    Model.Metrics = Metrics
+    try:
+        for Solver in Solvers:
+            Model.Solver = None
+            Frontier_Sweep(Model, V_Target, Solver)
+    finally:
+        Model.Metrics = Previous
+        Model.Solver = None
+    return Metrics
@@ -0,0 +1,46 @@
+import time
+import numpy as np
+from ges_critical_line import Box_QP
+
+
+def Tracking_Backtest(Asset, Index, Window, Rebalance=1, Refresh=None,
+                      Metrics=None):
+    # Metrics, a Solver_Metrics, gets one record per rebalancing QP.
+    Asset = np.asarray(Asset, dtype=float)
+    Index = np.asarray(Index, dtype=float)
+    T, N = Asset.shape
+    BackTesting = T - Window
+    Refresh = Window if Refresh is None else Refresh
+    V_Start = np.arange(0, BackTesting, Rebalance)
+    V_Weight = np.zeros((V_Start.shape[0], N))
+    V_Tracking = np.zeros(BackTesting)
+    # min ||Aw - b||^2 over the simplex, as 0.5 w'(A'A)w - (A'b)'w with
+    # no upper bounds, warm-started from the previous weights.
+    Lower, Upper = np.zeros(N), np.full(N, np.inf)
+    Weight = np.full(N, 1.0 / N)
+    Last = None
+    for idx, Start in enumerate(V_Start):
+        if Last is None or Start - Last >= Window or idx % Refresh == 0:
+            A = Asset[Start:(Start + Window)]
+            b = Index[Start:(Start + Window)]
+            Gram, Cross = A.T @ A, A.T @ b
+        else:
+            # Slide the window: add the new rows and drop the old ones.
+            Add = slice(Last + Window, Start + Window)
+            Drop = slice(Last, Start)
+            Gram += Asset[Add].T @ Asset[Add] - Asset[Drop].T @ Asset[Drop]
+            Cross += Asset[Add].T @ Index[Add] - Asset[Drop].T @ Index[Drop]
+        Time = time.perf_counter()
+        Weight, _, Iterations = Box_QP(Gram, -Cross, 1.0, Lower, Upper, Weight)
+        if Metrics is not None:
+            Time = time.perf_counter() - Time
+            Metrics.Record(measure='tracking error', formulation='active set',
+                           solver='Box_QP', period=int(Start),
+                           status='optimal', iterations=Iterations,
+                           solver_time=Time, compile=0.0, update=0.0,
+                           solve=Time, unpack=0.0, residual=np.nan)
+        V_Weight[idx, :] = Weight
+        Hold = slice(Start + Window, min(Start + Window + Rebalance, T))
+        V_Tracking[Start:(Start + Rebalance)] = Asset[Hold] @ Weight
+        Last = Start
+    return V_Weight, V_Tracking
@@ -0,0 +1,146 @@
+import numpy as np
+from scipy.interpolate import PchipInterpolator
+
+Interpolations = ('log-linear', 'monotone cubic')
+
+
+def Cash_Flow_Schedule(Maturity, CouponRate, FaceValue, Frequency=1):
+    # Payment times count back from maturity in steps of 1 / Frequency.
+    Maturity, CouponRate, FaceValue, Frequency = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (Maturity, CouponRate, FaceValue,
+                                               Frequency)))
+    Periods = np.ceil(Maturity * Frequency - 1e-9).astype(int)
+    Back = np.arange(Periods.max(initial=1))
+    Time = Maturity[..., np.newaxis] - Back / Frequency[..., np.newaxis]
+    Paid = Back < Periods[..., np.newaxis]
+    CF = np.where(Paid, (0.01 * CouponRate * FaceValue
+                         / Frequency)[..., np.newaxis], 0.0)
+    CF[..., 0] += FaceValue
+    return np.where(Paid, Time, 0.0), CF
+
+
+class Yield_Curve:
+    def __init__(self, Time, Log_Discount, Interpolation='log-linear',
+                 Cache_Size=4096):
+        if Interpolation not in Interpolations:
+            raise ValueError('unknown interpolation: {0}'
+                             .format(Interpolation))
+        self.Time = np.r_[0.0, Time]
+        self.Log_Discount = np.r_[0.0, Log_Discount]
+        self.Interpolation = Interpolation
+        self.Interpolant = PchipInterpolator(self.Time, self.Log_Discount) \
+                           if Interpolation == 'monotone cubic' else None
+        self.Tail_Slope = (self.Log_Discount[-1] - self.Log_Discount[-2]) \
+                          / (self.Time[-1] - self.Time[-2])
+        self.Cache_Size = Cache_Size
+        self.Cache_Time = np.zeros(0)
+        self.Cache_Value = np.zeros(0)
+
+    def Evaluate(self, t):
+        # Beyond the last node the last forward rate is held flat.
+        if self.Interpolant is None:
+            x = np.interp(t, self.Time, self.Log_Discount)
+        else:
+            x = self.Interpolant(np.minimum(t, self.Time[-1]))
+        Beyond = t > self.Time[-1]
+        x[Beyond] = self.Log_Discount[-1] \
+                    + self.Tail_Slope * (t[Beyond] - self.Time[-1])
+        return np.exp(x)
+
+    def Discount(self, t):
+        # Discount factors are cached by time, so repricing against the
+        # same curve only interpolates dates it has not seen before. New
+        # dates are merged into the sorted cache in place of a re-sort, and
+        # the cache starts over once it would hold more than Cache_Size.
+        t = np.asarray(t, dtype=float)
+        Unique, Inverse = np.unique(t, return_inverse=True)
+        Position = np.searchsorted(self.Cache_Time, Unique)
+        Found = Position < self.Cache_Time.shape[0]
+        Found[Found] = self.Cache_Time[Position[Found]] == Unique[Found]
+        if Found.all():
+            return self.Cache_Value[Position][Inverse].reshape(t.shape)[()]
+        Value = np.empty(Unique.shape)
+        Value[Found] = self.Cache_Value[Position[Found]]
+        Value[~Found] = self.Evaluate(Unique[~Found])
+        if self.Cache_Time.shape[0] + (~Found).sum() > self.Cache_Size:
+            self.Cache_Time, self.Cache_Value = Unique, Value
+            if Unique.shape[0] > self.Cache_Size:
+                self.Cache_Time, self.Cache_Value = np.zeros(0), np.zeros(0)
+        else:
+            self.Cache_Time = np.insert(self.Cache_Time, Position[~Found],
+                                        Unique[~Found])
+            self.Cache_Value = np.insert(self.Cache_Value, Position[~Found],
+                                         Value[~Found])
+        return Value[Inverse].reshape(t.shape)[()]
+
+    def Zero_Rate(self, t):
+        t = np.asarray(t, dtype=float)
+        return (self.Discount(t) ** (-1.0 / t) - 1.0) * 100
+
+    def Bond_Price(self, Maturity, CouponRate, FaceValue, Frequency=1):
+        # A bond is its face value times the discount factor at maturity
+        # plus its coupon times an annuity, and both depend only on the
+        # maturity and the frequency, so each schedule is valued once.
+        Maturity, CouponRate, FaceValue, Frequency = np.broadcast_arrays(
+            *(np.asarray(x, dtype=float) for x in (Maturity, CouponRate,
+                                                   FaceValue, Frequency)))
+        Schedule, Inverse = np.unique(np.stack((Maturity.ravel(),
+                                                Frequency.ravel()), axis=1),
+                                      axis=0, return_inverse=True)
+        Time = Cash_Flow_Schedule(Schedule[:, 0], 0.0, 1.0, Schedule[:, 1])[0]
+        Discount = np.where(Time > 0.0, self.Discount(Time), 0.0)
+        Terminal = Discount[:, 0][Inverse].reshape(Maturity.shape)
+        Annuity = Discount.sum(axis=1)[Inverse].reshape(Maturity.shape)
+        return (FaceValue * (Terminal + 0.01 * CouponRate / Frequency
+                             * Annuity))[()]
+
+
+def Bootstrap_Curve(Price, Maturity, CouponRate, FaceValue=100.0, Frequency=1,
+                    Interpolation='log-linear', Tol=1e-14, MaxIter=50):
+    # Nodes are solved in order of maturity. Cash flows up to the previous
+    # node are discounted on the curve built so far, and the rest lie on
+    # the log-linear segment to the new node, so each node is one scalar
+    # equation, solved by Newton's method (directly when only the final
+    # payment is unknown).
+    Price, Maturity = np.broadcast_arrays(np.asarray(Price, dtype=float),
+                                          np.asarray(Maturity, dtype=float))
+    Time, CF = Cash_Flow_Schedule(Maturity, CouponRate, FaceValue, Frequency)
+    Order = np.argsort(Maturity, kind='stable')
+    if np.any(np.diff(Maturity[Order]) <= 0.0):
+        raise ValueError('bond maturities must be distinct')
+    Node_Time = [0.0]
+    Node_Value = [0.0]
+    for i in Order:
+        Flow = CF[i] != 0.0
+        t, c = Time[i][Flow], CF[i][Flow]
+        t0, x0 = Node_Time[-1], Node_Value[-1]
+        Known = t <= t0
+        Residual = Price[i] - c[Known] @ np.exp(np.interp(t[Known], Node_Time,
+                                                          Node_Value))
+        s, c = (t[~Known] - t0) / (Maturity[i] - t0), c[~Known]
+        if s.shape[0] == 1:
+            x = np.log(Residual / c[0])
+        else:
+            x = x0 + np.log(Residual / c.sum())
+            for Iteration in range(MaxIter):
+                PV = c * np.exp(x0 + (x - x0) * s)
+                Step = (PV.sum() - Residual) / (PV @ s)
+                x -= Step
+                if abs(Step) <= Tol:
+                    break
+        Node_Time.append(Maturity[i])
+        Node_Value.append(x)
+    Node_Time, Node_Value = np.array(Node_Time[1:]), np.array(Node_Value[1:])
+    Curve = Yield_Curve(Node_Time, Node_Value, Interpolation)
+    if Interpolation != 'log-linear':
+        # Between nodes the spline differs from the log-linear segments the
+        # nodes were solved on, so correct each node by its own pricing
+        # error until every bond reprices.
+        for Iteration in range(MaxIter):
+            Error = (Curve.Bond_Price(Maturity, CouponRate, FaceValue,
+                                      Frequency) - Price)[Order]
+            if np.abs(Error).max() <= Tol * np.abs(Price).max():
+                break
+            Node_Value -= Error / (CF[Order, 0] * np.exp(Node_Value))
+            Curve = Yield_Curve(Node_Time, Node_Value, Interpolation)
+    return Curve
@@ -0,0 +1,180 @@
+import numpy as np
+import numpy.polynomial.polynomial as pol
+from ges_bond_engine import Bond_Cash_Flow_Matrix
+
+
+def IRR_Eigen(CF):
+    CF = np.atleast_2d(CF)
+    Rate = np.full(CF.shape[:-1], np.nan)
+    for idx in np.ndindex(Rate.shape):
+        Coefficient = np.trim_zeros(CF[idx], 'b')
+        if Coefficient.size < 2:
+            # A zero or constant profile has no root.
+            continue
+        Roots = pol.polyroots(Coefficient)
+        Real = np.real(Roots[np.isreal(Roots)])
+        Positive = Real[Real > 0.0]
+        if Positive.size > 0:
+            Rate[idx] = (1.0 / Positive.item(0) - 1.0) * 100
+    return Rate
+
+
+def Polynomial_Derivatives(x, CF):
+    f = np.zeros(x.shape)
+    df = np.zeros(x.shape)
+    d2f = np.zeros(x.shape)
+    for t in range(CF.shape[1] - 1, -1, -1):
+        d2f = d2f * x + df
+        df = df * x + f
+        f = f * x + CF[:, t]
+    return f, df, 2.0 * d2f
+
+
+# Discount factors x = 1/(1 + r) scanned for a sign change: steps of 0.005
+# in x on [0, 1], then steps of 0.5% in the rate from 0% down to -99.5%.
+IRR_Grid = np.r_[np.linspace(0.0, 1.0, 201),
+                 1.0 / (1.0 + 0.01 * np.arange(-0.5, -99.75, -0.5))]
+
+
+def Grid_Bracket(CF):
+    # The first grid interval on which each polynomial changes sign, or
+    # [0, 1] where it never does. Above x = 1 the sign is taken from the
+    # reversed polynomial in 1/x, which is x^(1-T) times the original
+    # and cannot overflow.
+    Power = np.arange(CF.shape[1])
+    Inside = IRR_Grid <= 1.0
+    f = np.concatenate(
+        (CF @ (IRR_Grid[Inside, np.newaxis] ** Power).T,
+         CF @ ((1.0 / IRR_Grid[~Inside, np.newaxis]) ** Power[::-1]).T), axis=1)
+    Negative = np.signbit(f)
+    Change = (Negative[:, 1:] != Negative[:, :-1]) | (f[:, 1:] == 0.0)
+    k = Change.argmax(axis=1)
+    Found = Change.any(axis=1)
+    return np.where(Found, IRR_Grid[k], 0.0), \
+           np.where(Found, IRR_Grid[k + 1], 1.0)
+
+
+def Solve_IRR(CF, Guess=None, Tol=1e-12, MaxIter=100, Fallback=False,
+              Bracket=None):
+    CF = np.asarray(CF, dtype=float)
+    Shape = CF.shape[:-1]
+    CF = CF.reshape(-1, CF.shape[-1])
+    M = CF.shape[0]
+    # Leading zero cash flows (a deferred start) only add the root x = 0,
+    # i.e. an infinite rate: divide out x^k by shifting each row left.
+    Lead = (np.cumsum(CF != 0.0, axis=1) == 0).sum(axis=1)
+    if Lead.any():
+        Column = np.arange(CF.shape[1]) + Lead[:, np.newaxis]
+        CF = np.where(Column < CF.shape[1], np.take_along_axis(
+            CF, np.minimum(Column, CF.shape[1] - 1), axis=1), 0.0)
+    # The IRR is 1/x - 1 for a root x > 0 of sum_t CF_t x^t, bracketed
+    # in [Lower, Upper] by a sign change of the polynomial: [0, 1] (the
+    # non-negative rates) when the polynomial changes sign there, and
+    # otherwise the first sign change on IRR_Grid. The grid also covers
+    # the negative rates and catches an even number of roots in [0, 1].
+    # Bracket = (Low, High) gives rate intervals holding a sign change,
+    # used instead where both ends are finite.
+    Lower = np.zeros(M)
+    f_Lower = CF[:, 0].copy()
+    Upper = np.ones(M)
+    f_Upper = CF.sum(axis=1)
+    if Bracket is not None:
+        Low, High = (np.broadcast_to(np.asarray(Rate, dtype=float),
+                                     Shape).ravel() for Rate in Bracket)
+        Given = np.flatnonzero(np.isfinite(Low) & np.isfinite(High))
+        Lower[Given] = 1.0 / (1.0 + 0.01 * np.maximum(Low, High)[Given])
+        Upper[Given] = 1.0 / (1.0 + 0.01 * np.minimum(Low, High)[Given])
+        f_Lower[Given] = Polynomial_Derivatives(Lower[Given], CF[Given])[0]
+        f_Upper[Given] = Polynomial_Derivatives(Upper[Given], CF[Given])[0]
+    Scan = np.flatnonzero(np.sign(f_Upper) == np.sign(f_Lower))
+    if Scan.size > 0:
+        Lower[Scan], Upper[Scan] = Grid_Bracket(CF[Scan])
+        f_Lower[Scan] = Polynomial_Derivatives(Lower[Scan], CF[Scan])[0]
+        f_Upper[Scan] = Polynomial_Derivatives(Upper[Scan], CF[Scan])[0]
+    Bracketed = (np.sign(f_Lower) != np.sign(f_Upper)) & (f_Lower != f_Upper)
+    x = Lower - f_Lower * (Upper - Lower) / np.where(Bracketed,
+                                                     f_Upper - f_Lower, 1.0)
+    if Guess is not None:
+        x_Guess = 1.0 / (1.0 + 0.01 * np.broadcast_to(Guess, Shape).ravel())
+        Inside = (x_Guess > Lower) & (x_Guess < Upper)
+        x = np.where(Inside, x_Guess, x)
+    Converged = np.zeros(M, dtype=bool)
+    Active = np.flatnonzero(Bracketed)
+    for _ in range(MaxIter):
+        if Active.size == 0:
+            break
+        xa, lo, hi = x[Active], Lower[Active], Upper[Active]
+        f, df, d2f = Polynomial_Derivatives(xa, CF[Active])
+        Same = np.sign(f) == np.sign(f_Lower[Active])
+        lo = np.where(Same, xa, lo)
+        hi = np.where(Same, hi, xa)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            Step = -2.0 * f * df / (2.0 * df ** 2 - f * d2f)
+            Step = np.where(np.isfinite(Step), Step, -f / df)
+        x_New = xa + Step
+        Outside = ~np.isfinite(x_New) | (x_New <= lo) | (x_New >= hi)
+        x_New = np.where(Outside, 0.5 * (lo + hi), x_New)
+        Done = (f == 0.0) | (np.abs(x_New - xa) <= Tol * np.maximum(1.0, xa)) \
+               | (hi - lo <= Tol * np.maximum(1.0, xa))
+        x[Active] = np.where(f == 0.0, xa, x_New)
+        Lower[Active], Upper[Active] = lo, hi
+        Converged[Active[Done]] = True
+        Active = Active[~Done]
+    with np.errstate(divide='ignore'):
+        Rate = np.where(Converged, (1.0 / x - 1.0) * 100, np.nan)
+    if Fallback and not Converged.all():
+        Rate[~Converged] = IRR_Eigen(CF[~Converged])
+    return Rate.reshape(Shape)[()], Converged.reshape(Shape)[()]
+
+
+def NPV_Table(CF, V_Rate):
+    # A single matrix product of the cash flows with the powers of the
+    # discount factors evaluates every profile at every rate; the result
+    # has the profile axes first and the rate axes last.
+    CF = np.asarray(CF, dtype=float)
+    x = 1.0 / (1.0 + 0.01 * np.asarray(V_Rate, dtype=float))
+    Power = x[..., np.newaxis] ** np.arange(CF.shape[-1])
+    return np.tensordot(CF, Power, axes=([-1], [-1]))[()]
+
+
+def Sign_Change(V_NPV, V_Rate):
+    # The grid interval [Low, High] of the first sign change of each NPV
+    # profile, with the NPV at both ends; NaN where there is none.
+    Negative = np.signbit(V_NPV)
+    Change = Negative[..., 1:] != Negative[..., :-1]
+    k = Change.argmax(axis=-1)[..., np.newaxis]
+    f0 = np.take_along_axis(V_NPV, k, axis=-1)[..., 0]
+    f1 = np.take_along_axis(V_NPV, k + 1, axis=-1)[..., 0]
+    Found = Change.any(axis=-1)
+    Low = np.where(Found, V_Rate[k[..., 0]], np.nan)
+    High = np.where(Found, V_Rate[k[..., 0] + 1], np.nan)
+    return Low, High, f0, f1
+
+
+def Break_Even_Rate(V_NPV, V_Rate):
+    # Interpolate linearly at the first sign change of each NPV profile
+    # on the rate grid; NaN where the profile never changes sign.
+    Low, High, f0, f1 = Sign_Change(V_NPV, V_Rate)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return Low - f0 * (High - Low) / (f1 - f0)
+
+
+def IRR_Table(CF, V_Rate, Fallback=False):
+    # The solver is confined to the grid interval of the tabulated sign
+    # change, so the IRR is the root next to the break-even rate rather
+    # than another root of the same profile.
+    V_Rate = np.asarray(V_Rate, dtype=float)
+    V_NPV = NPV_Table(CF, V_Rate)
+    Break_Even = Break_Even_Rate(V_NPV, V_Rate)
+    Low, High = Sign_Change(V_NPV, V_Rate)[:2]
+    Rate, Converged = Solve_IRR(CF, Guess=Break_Even, Fallback=Fallback,
+                                Bracket=(Low, High))
+    return V_NPV, Break_Even, Rate, Converged
+
+
+def Bond_Yield_Batch(Price, Maturity, CouponRate, FaceValue, Guess=None,
+                     Fallback=False):
+    Time, CF = Bond_Cash_Flow_Matrix(Maturity, CouponRate, FaceValue)
+    Price = np.broadcast_to(Price, CF.shape[:-1])
+    CF = np.concatenate((-Price[..., np.newaxis], CF), axis=-1)
+    return Solve_IRR(CF, Guess=Guess, Fallback=Fallback)
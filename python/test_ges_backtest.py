@@ -0,0 +1,54 @@
+import numpy as np
+import cvxpy as cp
+import pytest
+from ges_backtest import Backtest
+from ges_solver_metrics import Solver_Metrics
+from ges_tracking_backtest import Tracking_Backtest
+
+
+@pytest.fixture(scope='module')
+def Market():
+    Random = np.random.default_rng(0)
+    T, N = 120, 6
+    Asset = Random.normal(0.5, 4.0, size=(T, N))
+    Index = Asset @ Random.dirichlet(np.ones(N) * 0.5) \
+            + Random.normal(0.0, 1.0, size=T)
+    return Asset, Index
+
+
+@pytest.mark.parametrize('Rebalance', [1, 5, 30])
+def test_tracking_error_without_cost(Market, Rebalance):
+    Asset, Index = Market
+    Window = 30
+    V_Weight, V_Return, V_Turnover = Backtest(
+        Asset, 'tracking error', Window, Rebalance, Index=Index, Cost=0.0,
+        Solver=cp.CLARABEL)
+    Expected_Weight, Expected_Return = Tracking_Backtest(Asset, Index, Window,
+                                                         Rebalance)
+    np.testing.assert_allclose(V_Weight, Expected_Weight, atol=1e-6)
+    if Rebalance == 1:
+        # Between trades the backtest lets the weights drift.
+        np.testing.assert_allclose(V_Return, Expected_Return, atol=1e-5)
+
+
+def test_cost_is_charged_on_turnover(Market):
+    Asset, Index = Market
+    Free = Backtest(Asset, 'variance', 30, 5, Cost=0.0, Cost_Aversion=0.0)
+    Costly = Backtest(Asset, 'variance', 30, 5, Cost=0.001, Cost_Aversion=0.0)
+    np.testing.assert_allclose(Costly[0], Free[0], atol=1e-6)
+    Charge = np.zeros(Free[1].shape)
+    Charge[::5] = 100 * 0.001 * Free[2]
+    np.testing.assert_allclose(Free[1] - Costly[1], Charge, atol=1e-5)
+
+
+def test_metrics_record_every_solve(Market):
+    Asset, Index = Market
+    Rebalancing, Tracking = Solver_Metrics(), Solver_Metrics()
+    V_Weight = Backtest(Asset, 'tracking error', 30, 5, Index=Index,
+                        Metrics=Rebalancing)[0]
+    Tracking_Backtest(Asset, Index, 30, 5, Metrics=Tracking)
+    for Metrics in (Rebalancing, Tracking):
+        Table = Metrics.Table()
+        assert Table['period'].tolist() == list(range(0, 90, 5))
+        assert (Table['iterations'] > 0).all()
+    assert V_Weight.shape[0] == len(Rebalancing.Records)
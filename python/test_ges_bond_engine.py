@@ -0,0 +1,69 @@
+import numpy as np
+import numpy.polynomial.polynomial as pol
+import pytest
+from ges_bond_engine import Bond_Analytics, Bond_Grid_Analytics
+
+
+# The per-bond formulas of the original ges_bond_duration_convexity.py.
+def Bond_Price(Yield, Maturity, CouponRate, FaceValue):
+    Coupon = 0.01 * CouponRate * FaceValue
+    CF = np.hstack((0.0, np.tile(Coupon, int(Maturity) - 1), FaceValue + Coupon))
+    return pol.polyval(1.0 / (1.0 + 0.01 * Yield), CF)
+
+
+def Bond_Duration(Yield, Maturity, CouponRate, FaceValue):
+    Price = Bond_Price(Yield, Maturity, CouponRate, FaceValue)
+    Coupon = 0.01 * CouponRate * FaceValue
+    CF = np.hstack((np.tile(Coupon, int(Maturity) - 1), Coupon + FaceValue))
+    Coef = np.linspace(1, Maturity, Maturity) * CF
+    return pol.polyval(1.0 / (1.0 + 0.01 * Yield), np.hstack((0.0, Coef))) / Price
+
+
+def Bond_Convexity(Yield, Maturity, CouponRate, FaceValue):
+    Price = Bond_Price(Yield, Maturity, CouponRate, FaceValue)
+    Duration = Bond_Duration(Yield, Maturity, CouponRate, FaceValue)
+    Coupon = 0.01 * CouponRate * FaceValue
+    CF = np.hstack((np.tile(Coupon, int(Maturity) - 1), Coupon + FaceValue))
+    Coef = (np.linspace(1, Maturity, Maturity) - Duration)**2 * CF
+    Dispersion = pol.polyval(1.0 / (1.0 + 0.01 * Yield), np.hstack((0.0, Coef))) \
+                 / Price
+    return (Dispersion + (1.0 + Duration) * Duration) / (1.0 + 0.01 * Yield)**2
+
+
+def Original(Yield, Maturity, CouponRate, FaceValue):
+    return np.array([[f(y, m, c, v) for y, m, c, v in zip(Yield, Maturity,
+                                                          CouponRate, FaceValue)]
+                     for f in (Bond_Price, Bond_Duration, Bond_Convexity)])
+
+
+@pytest.fixture
+def Portfolio():
+    Random = np.random.default_rng(0)
+    Size = 200
+    return (Random.uniform(0.0, 12.0, Size), Random.integers(1, 31, Size),
+            Random.uniform(0.0, 10.0, Size),
+            Random.choice([100.0, 1000.0], Size))
+
+
+def test_bond_analytics_matches_original(Portfolio):
+    np.testing.assert_allclose(np.array(Bond_Analytics(*Portfolio)),
+                               Original(*Portfolio), rtol=1e-12)
+
+
+def test_scalar_bond():
+    Price, Duration, Convexity = Bond_Analytics(5, 10, 7, 100)
+    assert np.ndim(Price) == 0
+    np.testing.assert_allclose([Price, Duration, Convexity],
+                               Original([5], [10], [7], [100])[:, 0],
+                               rtol=1e-12)
+
+
+def test_grid_matches_original(Portfolio):
+    Yield, Maturity, CouponRate, FaceValue = Portfolio
+    V_Yield = np.linspace(0.0, 12.0, 9)
+    Grid = np.array(Bond_Grid_Analytics(V_Yield, Maturity, CouponRate,
+                                        FaceValue))
+    for idx, y in enumerate(V_Yield):
+        np.testing.assert_allclose(Grid[:, idx], Original(
+            np.full(Maturity.shape, y), Maturity, CouponRate, FaceValue),
+            rtol=1e-12)
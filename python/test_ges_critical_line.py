@@ -0,0 +1,46 @@
+import numpy as np
+import cvxpy as cp
+import pytest
+from ges_critical_line import Critical_Line, Critical_Line_Frontier
+
+
+def QP_Variance(Mu, Sigma, Target, Upper):
+    w = cp.Variable(Mu.shape[0])
+    Problem = cp.Problem(cp.Minimize(cp.quad_form(w, Sigma)),
+                         [Mu @ w == Target, cp.sum(w) == 1.0, w >= 0.0,
+                          w <= Upper])
+    Problem.solve(solver=cp.CLARABEL)
+    return Problem.value
+
+
+def QP_Return_Range(Mu, Sigma, Upper):
+    w = cp.Variable(Mu.shape[0])
+    Constraints = [cp.sum(w) == 1.0, w >= 0.0, w <= Upper]
+    cp.Problem(cp.Minimize(cp.quad_form(w, Sigma)), Constraints).solve(
+        solver=cp.CLARABEL)
+    Min_Variance = Mu @ w.value
+    return Min_Variance, cp.Problem(cp.Maximize(Mu @ w), Constraints).solve(
+        solver=cp.CLARABEL)
+
+
+@pytest.mark.parametrize('Mu', [[3, 2, 2, 2], [2, 2, 1], [3] + [2] * 9,
+                                [1, 1, 1, 1], [2, 2, 2, 1, 1, 1],
+                                [3, 3, 1, 1, 0.5]])
+@pytest.mark.parametrize('Upper', [1.0, 0.4])
+@pytest.mark.parametrize('Seed', range(3))
+def test_tied_mu_matches_qp(Mu, Upper, Seed):
+    Mu = np.asarray(Mu, dtype=float)
+    N = Mu.shape[0]
+    if Upper * N < 1.0:
+        pytest.skip('infeasible bounds')
+    X = np.random.default_rng(Seed).normal(size=(N + 3, N))
+    Sigma = X.T @ X / N + 0.1 * np.eye(N)
+    V_Return, V_Weight = Critical_Line(Mu, Sigma, Upper=Upper)
+    Low, High = QP_Return_Range(Mu, Sigma, Upper)
+    assert V_Return[0] == pytest.approx(Low, abs=1e-6)
+    assert V_Return[-1] == pytest.approx(High, abs=1e-6)
+    V_Target = np.linspace(V_Return[0], V_Return[-1], 7)
+    V_Variance = Critical_Line_Frontier(V_Return, V_Weight, Sigma,
+                                        V_Target)[0] ** 2
+    QP = np.array([QP_Variance(Mu, Sigma, t, Upper) for t in V_Target])
+    np.testing.assert_allclose(V_Variance, QP, rtol=1e-5)
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+from ges_cvar import CVaR_Frontier
+from ges_data import Load_Data, Data_File
+from ges_es_scenario import ES_Frontier_Grid
+from ges_frontier import Risk_Model
+
+
+@pytest.fixture(scope='module')
+def Return():
+    return Load_Data(Data_File('asset_return_data.csv')).values
+
+
+@pytest.mark.parametrize('Alpha', [0.05, 0.1, 0.25, 0.5])
+def test_cvar_matches_risk_model(Return, Alpha):
+    Mu = Return.mean(axis=0)
+    V_Target = np.linspace(Mu.min(), Mu.max(), 15)
+    V_Risk, V_VaR, V_Weight = CVaR_Frontier(Return, V_Target, Alpha)[:3]
+    Model = Risk_Model('expected shortfall', Return=Return, Alpha=Alpha)
+    Expected = np.array([Model.Solve(Target)[0] for Target in V_Target])
+    np.testing.assert_allclose(V_Risk, Expected, atol=1e-6)
+    np.testing.assert_allclose(V_Weight @ Mu, V_Target, atol=1e-8)
+    np.testing.assert_allclose(V_Weight.sum(axis=1), 1.0, atol=1e-8)
+
+
+def test_es_grid_engines_agree(Return):
+    Mu = Return.mean(axis=0)
+    V_Alpha = np.array([0.05, 0.25])
+    V_Target = np.linspace(Mu.min() - 0.1, Mu.max(), 8)
+    CVaR = ES_Frontier_Grid(Return, V_Alpha, V_Target, Workers=1)
+    Conic = ES_Frontier_Grid(Return, V_Alpha, V_Target, Workers=1,
+                             Engine='conic')
+    np.testing.assert_allclose(CVaR.values, Conic.values, atol=1e-6)
+    assert np.isnan(CVaR.values[0]).all()
@@ -0,0 +1,63 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from ges_data import Load_Data, Data_Statistics, Cache_Paths
+
+
+def Write_CSV(File, Values):
+    pd.DataFrame(Values, index=pd.date_range('2007-01-31', periods=len(Values),
+                                             freq='M'),
+                 columns=['A', 'B']).to_csv(File)
+
+
+def test_cache_matches_csv(tmp_path):
+    File = str(tmp_path / 'returns.csv')
+    Values = np.random.default_rng(0).normal(size=(250, 2))
+    Write_CSV(File, Values)
+    Data = Load_Data(File, Chunk_Size=64)
+    pd.testing.assert_frame_equal(Data, pd.read_csv(File, index_col=0,
+                                                    parse_dates=True),
+                                  check_freq=False)
+    T, Mu, Sigma = Data_Statistics(File)
+    assert T == 250
+    np.testing.assert_allclose(Mu, Values.mean(axis=0), rtol=1e-12)
+    np.testing.assert_allclose(Sigma, np.cov(Values.T, bias=True), rtol=1e-12)
+
+
+def test_cache_rebuilt_when_source_changes(tmp_path):
+    File = str(tmp_path / 'returns.csv')
+    Write_CSV(File, np.ones((5, 2)))
+    Load_Data(File)
+    Meta_Path = Cache_Paths(File)[1]
+    Built = os.stat(Meta_Path).st_mtime_ns
+    Load_Data(File)
+    assert os.stat(Meta_Path).st_mtime_ns == Built
+    # Same size, new contents, and a later modification time.
+    Write_CSV(File, 2.0 * np.ones((5, 2)))
+    Stamp = os.stat(File).st_mtime_ns + 10 ** 9
+    os.utime(File, ns=(Stamp, Stamp))
+    np.testing.assert_array_equal(Load_Data(File).values, 2.0)
+    assert Data_Statistics(File)[1].tolist() == [2.0, 2.0]
+
+
+def test_header_only_file(tmp_path):
+    File = str(tmp_path / 'empty.csv')
+    with open(File, 'w') as Output:
+        Output.write('Date,A,B\n')
+    Data = Load_Data(File)
+    assert Data.shape == (0, 2)
+    assert list(Data.columns) == ['A', 'B']
+    T, Mu, Sigma = Data_Statistics(File)
+    assert T == 0 and np.isnan(Mu).all() and np.isnan(Sigma).all()
+
+
+def test_frame_is_read_only(tmp_path):
+    File = str(tmp_path / 'returns.csv')
+    Write_CSV(File, np.ones((3, 2)))
+    Data = Load_Data(File)
+    with pytest.raises(ValueError):
+        Data.iloc[0, 0] = 2.0
+    Copy = Data.copy()
+    Copy.iloc[0, 0] = 2.0
+    assert Copy.iloc[0, 0] == 2.0
@@ -0,0 +1,14 @@
+import numpy as np
+import cvxpy as cp
+from ges_frontier import Risk_Model, Frontier_Sweep
+
+
+def test_solver_options_do_not_leak_between_solvers():
+    # OSQP writes its defaults into the options dict it is given; a later
+    # ECOS solve must not receive them.
+    Return = np.random.default_rng(0).normal(0.1, 1.0, (120, 6))
+    V_Target = np.linspace(0.05, 0.15, 4)
+    Model = Risk_Model('variance', Return=Return)
+    OSQP = Frontier_Sweep(Model, V_Target, cp.OSQP)[0]
+    ECOS = Frontier_Sweep(Model, V_Target, cp.ECOS)[0]
+    np.testing.assert_allclose(OSQP, ECOS, rtol=1e-3)
@@ -0,0 +1,20 @@
+import numpy as np
+import pytest
+from ges_regression import Factor_Regression, Rolling_Regression
+
+
+@pytest.mark.parametrize('Intercept', [True, False])
+@pytest.mark.parametrize('Refresh', [None, 1, 7])
+def test_rolling_matches_each_window(Intercept, Refresh):
+    Random = np.random.default_rng(0)
+    T, K, M, Window = 90, 3, 4, 24
+    X = Random.normal(size=(T, K))
+    Y = 0.5 + X @ Random.normal(size=(K, M)) + Random.normal(size=(T, M))
+    Rolling = Rolling_Regression(Y, X, Window, Intercept, Refresh)
+    assert Rolling[0].shape == (T - Window + 1, K + Intercept, M)
+    for Start in range(T - Window + 1):
+        Rows = slice(Start, Start + Window)
+        for Value, Expected in zip(Rolling, Factor_Regression(Y[Rows], X[Rows],
+                                                              Intercept)):
+            np.testing.assert_allclose(Value[Start], Expected, rtol=1e-8,
+                                       atol=1e-12)
@@ -0,0 +1,55 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from ges_data import Load_Data
+from ges_result_cache import Result_Cache, Memoize, Hash_Key
+
+
+@pytest.fixture
+def Cache(tmp_path):
+    return Result_Cache(str(tmp_path / 'results'))
+
+
+def test_miss_after_data_file_edit(tmp_path, Cache):
+    File = str(tmp_path / 'returns.csv')
+    pd.DataFrame({'A': [1.0, 2.0], 'B': [3.0, 4.0]}).to_csv(File)
+    Calls = []
+
+    @Memoize(Files=('File',), Ignore=('Workers',), Cache=Cache)
+    def Analysis(File, Workers=1):
+        Calls.append(Workers)
+        return Load_Data(File).values.sum()
+
+    assert Analysis(File) == 10.0
+    assert Analysis(File, Workers=4) == 10.0
+    assert len(Calls) == 1
+    assert Cache.Hits == {'memory': 1, 'disk': 0, 'miss': 1}
+    pd.DataFrame({'A': [1.0, 2.0], 'B': [3.0, 5.0]}).to_csv(File)
+    Stamp = os.stat(File).st_mtime_ns + 10 ** 9
+    os.utime(File, ns=(Stamp, Stamp))
+    assert Analysis(File) == 11.0
+    assert len(Calls) == 2
+
+
+def test_hits_from_disk_are_copies(Cache):
+    Calls = []
+
+    @Memoize(Cache=Cache)
+    def Square(x):
+        Calls.append(x)
+        return {'x': np.arange(3) * x}
+
+    First = Square(2)
+    First['x'][0] = 99
+    Cache.Memory.clear()
+    np.testing.assert_array_equal(Square(2)['x'], [0, 2, 4])
+    assert Calls == [2]
+    assert Cache.Hits['disk'] == 1
+
+
+def test_hash_key_distinguishes_types():
+    assert Hash_Key(1) != Hash_Key(1.0)
+    assert Hash_Key([1, 2]) != Hash_Key((1, 2))
+    assert Hash_Key(np.zeros(2)) != Hash_Key(np.zeros(2, dtype=np.float32))
+    assert Hash_Key({'a': 1, 'b': 2}) == Hash_Key({'b': 2, 'a': 1})
@@ -0,0 +1,26 @@
+import numpy as np
+from ges_simulation import Iterate_Simulation, Simulate_Returns
+
+Mu = np.array([1.0, 3.0, 1.5])
+Sigma = np.array([[25.0, 12.5, 6.75],
+                  [12.5, 100.0, 27.0],
+                  [6.75, 27.0, 56.25]])
+
+
+def test_workers_give_identical_samples(tmp_path):
+    Serial = Simulate_Returns(Mu, Sigma, 1050, str(tmp_path / 'serial.npy'),
+                              Seed=42, Chunk_Size=100, Workers=1)
+    Parallel = Simulate_Returns(Mu, Sigma, 1050, str(tmp_path / 'parallel.npy'),
+                                Seed=42, Chunk_Size=100, Workers=3)
+    np.testing.assert_array_equal(Serial, Parallel)
+    for Workers in (1, 3):
+        np.testing.assert_array_equal(np.concatenate(list(Iterate_Simulation(
+            Mu, Sigma, 1050, Seed=42, Chunk_Size=100, Workers=Workers))),
+            Serial)
+
+
+def test_sample_moments(tmp_path):
+    Sample = Simulate_Returns(Mu, Sigma, 200000, str(tmp_path / 'sample.npy'),
+                              Seed=1, Chunk_Size=30000)
+    np.testing.assert_allclose(Sample.mean(axis=0), Mu, atol=0.1)
+    np.testing.assert_allclose(np.cov(Sample.T), Sigma, rtol=0.02)
@@ -0,0 +1,35 @@
+import numpy as np
+import cvxpy as cp
+import pytest
+from ges_tracking_backtest import Tracking_Backtest
+
+
+def Market(T=150, N=8, Seed=0):
+    Random = np.random.default_rng(Seed)
+    Asset = Random.normal(0.5, 4.0, size=(T, N))
+    Index = Asset @ Random.dirichlet(np.ones(N) * 0.5) \
+            + Random.normal(0.0, 1.0, size=T)
+    return Asset, Index
+
+
+def QP_Tracking(A, b):
+    w = cp.Variable(A.shape[1])
+    cp.Problem(cp.Minimize(cp.sum_squares(A @ w - b)),
+               [cp.sum(w) == 1.0, w >= 0.0]).solve(solver=cp.CLARABEL)
+    return w.value
+
+
+@pytest.mark.parametrize('Rebalance', [1, 7, 40, 55])
+def test_weights_match_window_qp(Rebalance):
+    Asset, Index = Market()
+    Window = 40
+    V_Weight, V_Tracking = Tracking_Backtest(Asset, Index, Window, Rebalance)
+    V_Start = np.arange(0, Asset.shape[0] - Window, Rebalance)
+    assert V_Weight.shape[0] == V_Start.shape[0]
+    for Weight, Start in zip(V_Weight, V_Start):
+        Expected = QP_Tracking(Asset[Start:(Start + Window)],
+                               Index[Start:(Start + Window)])
+        np.testing.assert_allclose(Weight, Expected, atol=1e-6)
+    Held = np.repeat(V_Weight, Rebalance, axis=0)[:V_Tracking.shape[0]]
+    np.testing.assert_allclose(V_Tracking,
+                               np.einsum('ij,ij->i', Asset[Window:], Held))
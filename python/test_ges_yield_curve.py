@@ -0,0 +1,68 @@
+import numpy as np
+import numpy.linalg as la
+import pytest
+from ges_yield_curve import Bootstrap_Curve, Interpolations
+
+# The bonds of ges_bond_yield_curve.py: price, maturity and coupon rate.
+Bond = np.array([
+    [ 99.90,  1, 2.0],
+    [100.10,  2, 2.3],
+    [100.66,  3, 2.6],
+    [ 99.77,  4, 2.4],
+    [ 98.38,  5, 2.2],
+    [ 96.00,  6, 1.9],
+    [ 93.70,  7, 1.7],
+    [ 95.32,  8, 2.1],
+    [ 95.21,  9, 2.2],
+    [ 97.00, 10, 2.5]
+])
+
+
+def test_matches_dense_solve():
+    # The original script solved the triangular cash-flow system at once.
+    F = 100
+    C = F * np.identity(Bond.shape[0]) \
+        + np.tril(np.transpose(np.tile(0.01 * Bond[:, 2] * F,
+                                       (Bond.shape[0], 1))))
+    V = la.solve(C, Bond[:, 0])
+    Curve = Bootstrap_Curve(Bond[::-1, 0], Bond[::-1, 1], Bond[::-1, 2])
+    np.testing.assert_allclose(Curve.Discount(Bond[:, 1]), V, rtol=1e-13)
+    np.testing.assert_allclose(Curve.Zero_Rate(Bond[:, 1]),
+                               (np.power(1.0 / V, 1.0 / Bond[:, 1]) - 1.0)
+                               * 100, rtol=1e-11)
+
+
+@pytest.mark.parametrize('Interpolation', Interpolations)
+@pytest.mark.parametrize('Frequency', [1, 2, 4])
+def test_reprices_input_bonds(Interpolation, Frequency):
+    Random = np.random.default_rng(0)
+    Maturity = np.array([0.5, 1.0, 1.75, 3.0, 5.0, 7.5, 10.0, 20.0, 30.0])
+    CouponRate = Random.uniform(0.0, 6.0, Maturity.shape[0])
+    Rate = 0.02 + 0.01 * np.log1p(Maturity)
+    # Prices off a smooth curve, with coupons on the bonds' own schedules.
+    Times = np.maximum(Maturity[:, np.newaxis] - np.arange(120) / Frequency,
+                       0.0)
+    Flow = np.where(Times > 0.0, CouponRate[:, np.newaxis] / Frequency, 0.0)
+    Flow[:, 0] += 100
+    Price = (Flow * np.exp(-np.interp(Times, Maturity, Rate) * Times)).sum(1)
+    Curve = Bootstrap_Curve(Price, Maturity, CouponRate, 100.0, Frequency,
+                            Interpolation)
+    np.testing.assert_allclose(Curve.Bond_Price(Maturity, CouponRate, 100.0,
+                                                Frequency), Price, rtol=1e-12)
+    Discount = Curve.Discount(np.linspace(0.1, 40.0, 400))
+    assert np.all(np.diff(Discount) < 0.0)
+
+
+def test_discount_cache_is_exact_and_bounded():
+    Curve = Bootstrap_Curve(Bond[:, 0], Bond[:, 1], Bond[:, 2])
+    Curve.Cache_Size = 500
+    Random = np.random.default_rng(0)
+    for Size in (10, 50, 200, 300, 40, 600, 5):
+        t = np.round(Random.uniform(0.0, 15.0, (Size, 3)), 2)
+        np.testing.assert_array_equal(Curve.Discount(t), Curve.Evaluate(
+            t.ravel()).reshape(t.shape))
+        assert Curve.Cache_Time.shape[0] <= 500
+        assert np.all(np.diff(Curve.Cache_Time) > 0.0)
+        np.testing.assert_array_equal(Curve.Cache_Value,
+                                      Curve.Evaluate(Curve.Cache_Time))
+    assert np.ndim(Curve.Discount(2.5)) == 0
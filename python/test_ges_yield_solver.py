@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from ges_yield_solver import Solve_IRR, NPV_Table, IRR_Table, IRR_Eigen
+
+
+def test_even_number_of_roots():
+    # Roots at 10% and 20%; the polynomial has the same sign at 0% and at
+    # an infinite rate.
+    Rate, Converged = Solve_IRR([-100.0, 230.0, -132.0])
+    assert Converged
+    assert min(abs(Rate - 10.0), abs(Rate - 20.0)) < 1e-8
+
+
+def test_negative_rates_and_no_root():
+    CF = np.array([[-100.0, 10.0, 10.0], [-100.0, 50.0, 60.0],
+                   [100.0, 10.0, 10.0], [0.0, 0.0, 0.0]])
+    Rate, Converged = Solve_IRR(CF)
+    np.testing.assert_array_equal(Converged, [True, True, False, False])
+    assert Rate[0] < 0.0
+    np.testing.assert_allclose(NPV_Table(CF[:2], Rate[:2])[[0, 1], [0, 1]],
+                               0.0, atol=1e-8)
+    assert np.isnan(Rate[2:]).all()
+
+
+def test_irr_table_matches_break_even():
+    Rng = np.random.default_rng(0)
+    CF = np.round(Rng.normal(0.0, 50.0, (300, 6)))
+    CF[:, 0] = -100.0
+    V_Rate = np.linspace(-50.0, 60.0, 111)
+    V_NPV, Break_Even, Rate, Converged = IRR_Table(CF, V_Rate)
+    Found = np.isfinite(Break_Even)
+    assert Converged[Found].all()
+    np.testing.assert_allclose(Rate[Found], Break_Even[Found], atol=1.0)
+
+
+def test_irr_eigen_zero_profile():
+    assert np.isnan(IRR_Eigen(np.zeros((2, 4)))).all()
+
+
+def test_deferred_start():
+    # A leading zero adds the trivial root x = 0, an infinite rate.
+    Rate, Converged = Solve_IRR([0.0, -100.0, 110.0])
+    assert Converged
+    assert Rate == pytest.approx(10.0)
+    assert IRR_Eigen([0.0, -100.0, 110.0])[0] == pytest.approx(10.0)
+    Rate, Converged = Solve_IRR([[0.0, 0.0, -100.0, 110.0],
+                                 [-100.0, 110.0, 0.0, 0.0]])
+    np.testing.assert_allclose(Rate, 10.0)